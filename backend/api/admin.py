@@ -1,5 +1,6 @@
 # backend/api/admin.py
 """관리자 API"""
+import asyncio
 from datetime import date
 import json
 import os
@@ -12,6 +13,7 @@ from backend.schemas.admin import (
     RefreshDataRequest, RefreshDataResponse
 )
 from backend.services.database import postgres_connection, duckdb_connection
+from backend.services.problem_service import load_problem_file
 from backend.api.auth import get_session
 from backend.services.db_logger import get_logs, db_log, LogCategory, LogLevel
 
@@ -56,29 +58,30 @@ async def get_system_status(admin=Depends(require_admin)):
         with postgres_connection() as pg:
             postgres_connected = True
             
+            # 행 수는 planner 통계(reltuples) 추정치 - 테이블 스캔 없이 한 번에 조회
+            # (정확한 값은 /admin/table-count/{table_name})
             table_df = pg.fetch_df("""
-                SELECT table_name FROM information_schema.tables
-                WHERE table_schema = 'public' ORDER BY table_name
+                SELECT 
+                    c.relname as table_name,
+                    GREATEST(c.reltuples, 0)::bigint as row_count,
+                    COUNT(a.attnum) as column_count
+                FROM pg_class c
+                JOIN pg_namespace n ON n.oid = c.relnamespace
+                LEFT JOIN pg_attribute a 
+                    ON a.attrelid = c.oid AND a.attnum > 0 AND NOT a.attisdropped
+                WHERE n.nspname = 'public' AND c.relkind IN ('r', 'p')
+                GROUP BY c.relname, c.reltuples
+                ORDER BY c.relname
             """)
             
-            for _, row in table_df.iterrows():
-                tbl = row["table_name"]
-                try:
-                    cnt = pg.fetch_df(f"SELECT COUNT(*) as cnt FROM {tbl}")
-                    row_count = int(cnt.iloc[0]["cnt"])
-                except:
-                    row_count = 0
-                
-                col_cnt = pg.fetch_df(f"""
-                    SELECT COUNT(*) as cnt FROM information_schema.columns
-                    WHERE table_name = '{tbl}'
-                """)
-                
-                tables.append(DatabaseTable(
-                    table_name=tbl,
-                    row_count=row_count,
-                    column_count=int(col_cnt.iloc[0]["cnt"])
-                ))
+            tables = [
+                DatabaseTable(
+                    table_name=r["table_name"],
+                    row_count=int(r["row_count"]),
+                    column_count=int(r["column_count"])
+                )
+                for r in table_df.to_dict("records")
+            ]
     except:
         pass
     
@@ -116,8 +119,7 @@ async def get_system_status(admin=Depends(require_admin)):
     
     try:
         if os.path.exists(problem_path):
-            with open(problem_path, encoding="utf-8") as f:
-                problems = json.load(f)
+            problems = load_problem_file(problem_path)
             
             difficulties = {}
             for p in problems:
@@ -209,12 +211,16 @@ async def refresh_data(request: RefreshDataRequest):
     """데이터 갱신"""
     try:
         from generator.data_generator_advanced import generate_data
+        from backend.scheduler import invalidate_data_caches
         
+        # 생성은 수 분 걸리는 동기 작업이므로 스레드에서 실행 (이벤트 루프 차단 방지)
         if request.data_type == "pa":
-            generate_data(modes=("pa",))
+            await asyncio.to_thread(generate_data, modes=("pa",))
+            invalidate_data_caches()
             return RefreshDataResponse(success=True, message="PA 데이터 갱신 완료")
         elif request.data_type == "stream":
-            generate_data(modes=("stream",))
+            await asyncio.to_thread(generate_data, modes=("stream",))
+            invalidate_data_caches()
             return RefreshDataResponse(success=True, message="Stream 데이터 갱신 완료")
         else:
             return RefreshDataResponse(success=False, message="잘못된 data_type")
@@ -277,9 +283,8 @@ async def get_problem_files(admin=Depends(require_admin)):
             
             # 문제 개수 확인
             try:
-                with open(f, 'r') as fp:
-                    data = json.load(fp)
-                    problem_count = len(data) if isinstance(data, list) else 1
+                data = load_problem_file(f)
+                problem_count = len(data) if isinstance(data, list) else 1
             except:
                 problem_count = 0
             
@@ -367,15 +372,15 @@ async def run_scheduler_job(job_type: str, admin=Depends(require_admin)):
     try:
         if job_type == "weekday":
             from backend.scheduler import run_weekday_generation
-            run_weekday_generation()
+            await run_weekday_generation()
             return {"success": True, "message": "평일 문제/데이터 생성 작업 실행됨"}
         elif job_type == "sunday":
             from backend.scheduler import run_sunday_generation
-            run_sunday_generation()
+            await asyncio.to_thread(run_sunday_generation)
             return {"success": True, "message": "일요일 Stream 데이터 생성 작업 실행됨"}
         elif job_type == "cleanup":
             from backend.scheduler import cleanup_old_data
-            cleanup_old_data()
+            await asyncio.to_thread(cleanup_old_data)
             return {"success": True, "message": "데이터 정리 작업 실행됨"}
         else:
             return {"success": False, "message": f"알 수 없는 작업 타입: {job_type}"}
@@ -383,6 +388,34 @@ async def run_scheduler_job(job_type: str, admin=Depends(require_admin)):
         return {"success": False, "message": str(e)}
 
 
+@router.get("/table-count/{table_name}")
+async def get_exact_table_count(table_name: str, admin=Depends(require_admin)):
+    """테이블 정확한 행 수 (COUNT(*) - 전체 스캔)"""
+    from psycopg2 import sql as pgsql
+    
+    try:
+        with postgres_connection() as pg:
+            if not pg.table_exists(table_name):
+                raise HTTPException(404, f"테이블이 없습니다: {table_name}")
+            query = pgsql.SQL("SELECT COUNT(*) as cnt FROM {}").format(
+                pgsql.Identifier("public", table_name)
+            )
+            df = pg.fetch_df(query.as_string(pg.conn))
+        return {"table_name": table_name, "row_count": int(df.iloc[0]["cnt"])}
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(500, f"행 수 조회 실패: {str(e)}")
+
+
+@router.post("/refresh-schema-cache")
+async def refresh_schema_cache(admin=Depends(require_admin)):
+    """테이블 스키마 캐시 초기화 (DB를 직접 변경한 경우)"""
+    from backend.services.problem_service import clear_schema_cache
+    clear_schema_cache()
+    return {"success": True, "message": "스키마 캐시 초기화 완료"}
+
+
 @router.post("/reset-submissions")
 async def reset_submissions(admin=Depends(require_admin)):
     """제출 기록 초기화 및 XP 리셋"""
@@ -441,9 +474,8 @@ async def get_all_users(admin=Depends(require_admin)):
                 FROM users
                 ORDER BY created_at DESC
             """)
-            users = []
-            for _, row in df.iterrows():
-                users.append({
+            users = [
+                {
                     "id": row["id"],
                     "email": row["email"],
                     "name": row["name"],
@@ -452,7 +484,9 @@ async def get_all_users(admin=Depends(require_admin)):
                     "level": int(row.get("level", 1)),
                     "is_admin": bool(row.get("is_admin", False)),
                     "created_at": row["created_at"].isoformat() if row["created_at"] else None
-                })
+                }
+                for row in df.to_dict("records")
+            ]
             return {"success": True, "users": users, "count": len(users)}
     except Exception as e:
         return {"success": False, "message": str(e), "users": []}
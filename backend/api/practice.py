@@ -1,5 +1,6 @@
 # backend/api/practice.py
 """무한 연습 모드 API"""
+import asyncio
 from datetime import date
 from fastapi import APIRouter, HTTPException, Request
 from pydantic import BaseModel
@@ -12,10 +13,14 @@ from backend.services.database import postgres_connection
 
 router = APIRouter(prefix="/practice", tags=["practice"])
 
+# 난이도별 정답 XP
+DIFFICULTY_XP = {"easy": 3, "medium": 5, "hard": 8}
+
 
 class GeneratePracticeRequest(BaseModel):
     """연습 문제 생성 요청"""
     data_type: str = "pa"  # pa or stream
+    refresh: bool = False  # True면 캐시를 건너뛰고 새로 생성
 
 
 class PracticeProblem(BaseModel):
@@ -48,9 +53,11 @@ class SubmitPracticeRequest(BaseModel):
 async def generate_practice_problem(request: GeneratePracticeRequest):
     """연습 문제 1개 생성 (Gemini 호출)"""
     try:
-        from problems.prompt_pa import build_pa_prompt
+        from problems.prompt_pa import build_pa_prompt, build_pa_dynamic_suffix
         from problems.prompt import get_data_summary
-        from problems.gemini import call_gemini_json
+        from problems.prompt_cache import get_or_create_daily_cache
+        from problems.gemini import call_gemini_json_async
+        from problems import gen_cache
         
         # 현재 프로덕트 타입 가져오기
         try:
@@ -63,17 +70,28 @@ async def generate_practice_problem(request: GeneratePracticeRequest):
         # 데이터 요약 가져오기
         data_summary = get_data_summary()
         
-        # Gemini에 문제 1개만 요청
-        prompt = build_pa_prompt(data_summary, n=1, product_type=product_type)
-        problems = call_gemini_json(prompt)
-        
-        if not problems or len(problems) == 0:
-            return GeneratePracticeResponse(
-                success=False,
-                message="문제 생성에 실패했습니다."
-            )
+        # 같은 조건으로 생성된 문제가 충분하면 일부 요청은 재사용
+        gen_key = gen_cache.cache_key(product_type, request.data_type, data_summary)
+        p = None if request.refresh else gen_cache.draw(gen_key)
+        
+        if p is None:
+            # Gemini에 문제 1개만 요청 (오늘자 prefix 캐시가 있으면 suffix만 전송)
+            cache_name = await asyncio.to_thread(get_or_create_daily_cache, product_type, data_summary)
+            if cache_name:
+                problems = await call_gemini_json_async(build_pa_dynamic_suffix(n=1), cached_content=cache_name)
+            else:
+                prompt = build_pa_prompt(data_summary, n=1, product_type=product_type)
+                problems = await call_gemini_json_async(prompt)
+            
+            if not problems or len(problems) == 0:
+                return GeneratePracticeResponse(
+                    success=False,
+                    message="문제 생성에 실패했습니다."
+                )
+            
+            p = problems[0]
+            gen_cache.store(gen_key, p)
         
-        p = problems[0]
         problem_id = f"practice_{uuid.uuid4().hex[:8]}"
         
         # Gemini 응답 필드: question 또는 description
@@ -101,8 +119,9 @@ async def generate_practice_problem(request: GeneratePracticeRequest):
 async def submit_practice(request: SubmitPracticeRequest, req: Request):
     """연습 문제 제출 및 채점 (레벨업에 반영)"""
     try:
-        from grader.sql_grader import SQLGrader
-        from backend.services.grading_service import save_submission_pg, award_xp
+        from backend.services.grading_service import save_submission_pg, award_xp, compare_results
+        from backend.services.result_cache import execute_sql_cached
+        from backend.services.sql_service import is_safe_sql
         from backend.api.auth import get_session
         from datetime import date
         
@@ -114,10 +133,10 @@ async def submit_practice(request: SubmitPracticeRequest, req: Request):
             if session and session.get("user"):
                 user_id = session["user"].get("id")
         
-        grader = SQLGrader()
-        
-        # 정답 SQL 실행
-        expected_result = grader.execute_sql(request.answer_sql, data_type=request.data_type)
+        # 정답 SQL 실행 (같은 문제 재제출 시 캐시 사용, 블로킹 DB 작업은 스레드로 위임)
+        expected_result = await asyncio.to_thread(
+            execute_sql_cached, request.answer_sql, data_type=request.data_type
+        )
         if not expected_result["success"]:
             return {
                 "success": False,
@@ -126,7 +145,16 @@ async def submit_practice(request: SubmitPracticeRequest, req: Request):
             }
         
         # 사용자 SQL 실행 및 비교
-        user_result = grader.execute_sql(request.sql, data_type=request.data_type)
+        is_safe, error_msg = is_safe_sql(request.sql)
+        if not is_safe:
+            return {
+                "success": True,
+                "is_correct": False,
+                "message": f"SQL 실행 오류: {error_msg}"
+            }
+        user_result = await asyncio.to_thread(
+            execute_sql_cached, request.sql, data_type=request.data_type
+        )
         if not user_result["success"]:
             return {
                 "success": True,
@@ -135,11 +163,12 @@ async def submit_practice(request: SubmitPracticeRequest, req: Request):
             }
         
         # 결과 비교
-        is_correct = grader.compare_results(expected_result["data"], user_result["data"])
+        is_correct, _ = await asyncio.to_thread(
+            compare_results, user_result["data"], expected_result["data"]
+        )
         
         # 점수 계산
         xp_value = 0
-        DIFFICULTY_XP = {'easy': 3, 'medium': 5, 'hard': 8}
         if is_correct:
             xp_value = DIFFICULTY_XP.get(request.difficulty, 5)
         
@@ -158,7 +187,7 @@ async def submit_practice(request: SubmitPracticeRequest, req: Request):
             
             # 정답인 경우 XP 지급
             if is_correct and user_id:
-                award_xp(user_id, xp_value)
+                await asyncio.to_thread(award_xp, user_id, xp_value)
         except Exception:
             pass  # 저장 실패해도 채점 결과는 반환
         
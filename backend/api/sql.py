@@ -57,7 +57,7 @@ async def submit_answer(request: SubmitRequest, req: Request):
         if session and session.get("user"):
             user_id = session["user"].get("id")
     
-    return grade_submission(
+    return await grade_submission(
         problem_id=request.problem_id,
         sql=request.sql,
         data_type=getattr(request, 'data_type', 'pa'),
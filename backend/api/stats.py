@@ -40,6 +40,24 @@ async def get_history(request: Request, limit: int = 20, data_type: Optional[str
 
 
 
+# 리더보드 등급 (정답 수 기준, 높은 기준부터)
+LEADERBOARD_TIERS = [
+    (100, "🏆 Master"),
+    (50, "💎 Diamond"),
+    (20, "🥇 Gold"),
+    (10, "🥈 Silver"),
+    (5, "🥉 Bronze"),
+]
+
+
+def leaderboard_tier(correct_count: int) -> str:
+    """정답 수로 리더보드 등급 계산"""
+    for threshold, name in LEADERBOARD_TIERS:
+        if correct_count >= threshold:
+            return name
+    return "🌱 Beginner"
+
+
 @router.get("/leaderboard")
 async def get_leaderboard(limit: int = 20):
     """리더보드 조회 - 닉네임 기준"""
@@ -51,41 +69,32 @@ async def get_leaderboard(limit: int = 20):
                     SELECT 
                         u.id,
                         COALESCE(u.nickname, u.name, 'Anonymous') as nickname,
-                        COUNT(DISTINCT CASE WHEN s.is_correct THEN s.session_date END) as correct_days,
-                        COUNT(CASE WHEN s.is_correct THEN 1 END) as correct_count
+                        COUNT(DISTINCT s.session_date) as correct_days,
+                        COUNT(*) as correct_count
                     FROM users u
-                    LEFT JOIN submissions s ON s.user_id = u.id
+                    -- 정답 조건을 조인에 두어 부분 인덱스(idx_submissions_user_correct) 사용
+                    JOIN submissions s ON s.user_id = u.id AND s.is_correct
                     GROUP BY u.id, u.nickname, u.name
                 )
                 SELECT 
                     nickname,
                     correct_count as correct,
-                    correct_days as streak,
-                    CASE 
-                        WHEN correct_count >= 100 THEN '🏆 Master'
-                        WHEN correct_count >= 50 THEN '💎 Diamond'
-                        WHEN correct_count >= 20 THEN '🥇 Gold'
-                        WHEN correct_count >= 10 THEN '🥈 Silver'
-                        WHEN correct_count >= 5 THEN '🥉 Bronze'
-                        ELSE '🌱 Beginner'
-                    END as level
+                    correct_days as streak
                 FROM user_stats
-                WHERE correct_count > 0
                 ORDER BY correct_count DESC, streak DESC
                 LIMIT %s
             """, [limit])
-            
-            result = []
-            for idx, row in df.iterrows():
-                result.append({
-                    "rank": idx + 1,
-                    "nickname": row['nickname'],
-                    "correct": int(row['correct']),
-                    "streak": int(row['streak']),
-                    "level": row['level']
-                })
-            
-            return result
+        
+        return [
+            {
+                "rank": idx + 1,
+                "nickname": row["nickname"],
+                "correct": int(row["correct"]),
+                "streak": int(row["streak"]),
+                "level": leaderboard_tier(int(row["correct"]))
+            }
+            for idx, row in enumerate(df.to_dict("records"))
+        ]
     except Exception as e:
         logger.error(f"Failed to get leaderboard: {e}")
         return []
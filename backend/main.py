@@ -13,11 +13,17 @@ from backend.api.stats import router as stats_router
 from backend.api.admin import router as admin_router
 from backend.api.auth import router as auth_router
 from backend.api.practice import router as practice_router
+from backend.services.database import warm_postgres_pool, close_postgres_pool, close_duckdb
+from backend.services.submission_queue import start_submission_writer, stop_submission_writer
+from problems.gemini import close_gemini_clients
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    """앱 수명 주기 관리 - 스케줄러 시작/중지"""
+    """앱 수명 주기 관리 - DB 커넥션 풀 준비, 제출 저장 큐, 스케줄러 시작/중지"""
+    await warm_postgres_pool()
+    await start_submission_writer()
+
     # 스케줄러 시작 (환경변수로 활성화)
     if os.getenv("ENABLE_SCHEDULER", "false").lower() == "true":
         from backend.scheduler import start_scheduler, stop_scheduler
@@ -27,6 +33,15 @@ async def lifespan(app: FastAPI):
     else:
         yield
 
+    # 대기 중인 제출 기록 저장
+    await stop_submission_writer()
+
+    # Gemini 비동기 클라이언트 정리 (사용된 경우에만)
+    await close_gemini_clients()
+
+    close_postgres_pool()
+    close_duckdb()
+
 
 app = FastAPI(
     title="SQL Analytics Lab API",
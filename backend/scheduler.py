@@ -2,34 +2,60 @@
 """백엔드 내장 스케줄러 - APScheduler 기반
 - 월~금 새벽 1:00 (KST): PA 문제, Stream 문제, PA 데이터 생성
 - 일요일 새벽 1:00 (KST): Stream 데이터 생성
+- 평일 문제는 Gemini Batch API로 제출 후 KST 7:00에 수집 (GEMINI_BATCH_ENABLED=false면 동기 생성)
 """
-from apscheduler.schedulers.background import BackgroundScheduler
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 from datetime import date, timedelta, datetime
+import asyncio
 import os
-import glob
+import re
 
 from common.logging import get_logger
 from backend.services.db_logger import db_log, LogCategory, LogLevel
 
 logger = get_logger(__name__)
 
-scheduler = BackgroundScheduler()
+# FastAPI 이벤트 루프에서 실행 (코루틴 작업은 루프에서, 동기 작업은 스레드풀에서)
+scheduler = AsyncIOScheduler()
 
 # 보관 일수 (이전 문제 파일 및 정답 테이블)
 RETENTION_DAYS = 30
 
+# 파일명 날짜 추출: 2025-01-01.json, 2025-01-01_set0.json, stream_2025-01-01.json, pa_2025-01.json
+_DATED_FILE_RE = re.compile(r"^(?:stream_|pa_)?(\d{4}-\d{2}(?:-\d{2})?)")
+# 정답 테이블명 날짜 추출: expected_2025-01-01_...
+_GRADING_TABLE_RE = re.compile(r"^expected_(\d{4}-\d{2}-\d{2})")
+
+# 평일 문제 생성을 Batch API로 처리할지 여부
+BATCH_ENABLED = os.getenv("GEMINI_BATCH_ENABLED", "true").lower() == "true"
+
 # 마지막 실행 시간 기록
 last_run_times = {
     "weekday_job": None,
+    "weekday_collect": None,
     "sunday_job": None,
     "cleanup_job": None
 }
 
 
+def _expired_files(directory: str, is_expired) -> list[str]:
+    """디렉터리에서 파일명 날짜가 만료된 JSON 파일 경로 목록"""
+    if not os.path.isdir(directory):
+        return []
+    with os.scandir(directory) as entries:
+        victims = []
+        for entry in entries:
+            match = _DATED_FILE_RE.match(entry.name)
+            if match and entry.name.endswith(".json") and is_expired(match.group(1)):
+                victims.append(entry.path)
+    return victims
+
+
 def cleanup_old_data():
     """오래된 문제 파일과 정답 테이블 정리"""
     cutoff_date = date.today() - timedelta(days=RETENTION_DAYS)
+    cutoff_day = cutoff_date.isoformat()
     cutoff_month = (date.today() - timedelta(days=90)).strftime("%Y-%m")
     logger.info(f"[SCHEDULER] Cleaning up data older than {cutoff_date}")
     
@@ -37,44 +63,23 @@ def cleanup_old_data():
     deleted_tables = 0
     
     try:
-        # 1. 오래된 daily 문제 파일 삭제
-        problem_files = glob.glob("problems/daily/*.json")
-        for filepath in problem_files:
-            filename = os.path.basename(filepath)
-            try:
-                if filename.startswith("stream_"):
-                    date_str = filename[7:17]
-                else:
-                    date_str = filename[:10]
-                
-                file_date = date.fromisoformat(date_str)
-                if file_date < cutoff_date:
-                    os.remove(filepath)
-                    deleted_files += 1
-                    logger.info(f"[CLEANUP] Deleted old daily file: {filepath}")
-            except (ValueError, IndexError):
-                continue
-        
+        # 1. 오래된 daily 문제 파일 삭제 (ISO 날짜는 문자열 비교로 충분)
         # 2. 오래된 monthly 파일 삭제 (3개월 이전)
-        monthly_files = glob.glob("problems/monthly/*.json")
-        for filepath in monthly_files:
-            filename = os.path.basename(filepath)
+        victims = _expired_files(
+            "problems/daily", lambda d: len(d) == 10 and d < cutoff_day
+        ) + _expired_files(
+            "problems/monthly", lambda d: len(d) == 7 and d < cutoff_month
+        )
+        for filepath in victims:
             try:
-                if filename.startswith("pa_"):
-                    month_str = filename[3:10]
-                elif filename.startswith("stream_"):
-                    month_str = filename[7:14]
-                else:
-                    continue
-                
-                if month_str < cutoff_month:
-                    os.remove(filepath)
-                    deleted_files += 1
-                    logger.info(f"[CLEANUP] Deleted old monthly file: {filepath}")
-            except (ValueError, IndexError):
+                os.remove(filepath)
+                deleted_files += 1
+            except OSError:
                 continue
+        if deleted_files:
+            logger.info(f"[CLEANUP] Deleted {deleted_files} old problem files")
         
-        # 3. 오래된 grading 테이블 삭제
+        # 3. 오래된 grading 테이블 삭제 (한 번의 DROP으로 처리)
         from backend.services.database import postgres_connection
         with postgres_connection() as pg:
             tables_df = pg.fetch_df("""
@@ -82,18 +87,19 @@ def cleanup_old_data():
                 WHERE table_schema = 'grading' AND table_name LIKE 'expected_%'
             """)
             
-            for _, row in tables_df.iterrows():
-                table_name = row["table_name"]
-                try:
-                    if len(table_name) > 19 and table_name[9:19].count("-") == 2:
-                        date_str = table_name[9:19]
-                        table_date = date.fromisoformat(date_str)
-                        if table_date < cutoff_date:
-                            pg.execute(f"DROP TABLE IF EXISTS grading.{table_name}")
-                            deleted_tables += 1
-                            logger.info(f"[CLEANUP] Dropped old grading table: {table_name}")
-                except (ValueError, IndexError):
-                    continue
+            old_tables = []
+            for table_name in tables_df["table_name"]:
+                match = _GRADING_TABLE_RE.match(table_name)
+                if match and match.group(1) < cutoff_day:
+                    old_tables.append(table_name)
+            
+            if old_tables:
+                pg.execute(
+                    "DROP TABLE IF EXISTS "
+                    + ", ".join(f'grading."{t}"' for t in old_tables)
+                )
+                deleted_tables = len(old_tables)
+                logger.info(f"[CLEANUP] Dropped old grading tables: {old_tables}")
         
         last_run_times["cleanup_job"] = datetime.now()
         
@@ -108,9 +114,72 @@ def cleanup_old_data():
         
     except Exception as e:
         logger.error(f"[CLEANUP] Error: {str(e)}")
+    
+    # Gemini 응답 캐시 정리 (실패해도 위 정리 작업에 영향 없음)
+    try:
+        from problems.gemini import prune_response_cache
+        pruned = prune_response_cache(RETENTION_DAYS)
+        if pruned:
+            logger.info(f"[CLEANUP] Deleted {pruned} cached gemini responses")
+    except Exception as e:
+        logger.error(f"[CLEANUP] Response cache prune error: {str(e)}")
+
+
+def invalidate_data_caches():
+    """데이터/문제 갱신 후 스키마·데이터 요약·SQL 결과·연습 문제 캐시 무효화"""
+    from backend.services.problem_service import clear_schema_cache
+    from backend.services.result_cache import clear_result_cache
+    from problems.prompt import clear_data_summary_cache
+    from problems import gen_cache
+    clear_schema_cache()
+    clear_data_summary_cache()
+    clear_result_cache()
+    gen_cache.clear()
+
+
+def _generate_pa_problems(today: date):
+    """PA 문제 생성 (워커 스레드에서 실행, 자체 풀 연결 사용)"""
+    pa_problem_path = f"problems/daily/{today}.json"
+    if os.path.exists(pa_problem_path):
+        logger.info(f"[SCHEDULER] PA problems already exist: {pa_problem_path}")
+        return
+    
+    from backend.services.database import postgres_connection
+    from problems.generator import generate as gen_pa_problems
+    
+    logger.info("[SCHEDULER] Generating PA problems...")
+    with postgres_connection() as pg:
+        gen_pa_problems(today, pg)
+    db_log(
+        category=LogCategory.PROBLEM_GENERATION,
+        message=f"PA 문제 생성 완료: {today}",
+        level=LogLevel.INFO,
+        source="scheduler"
+    )
 
 
-def run_weekday_generation():
+def _generate_stream_problems(today: date):
+    """Stream 문제 생성 (워커 스레드에서 실행, 자체 풀 연결 사용)"""
+    stream_problem_path = f"problems/daily/stream_{today}.json"
+    if os.path.exists(stream_problem_path):
+        logger.info(f"[SCHEDULER] Stream problems already exist: {stream_problem_path}")
+        return
+    
+    from backend.services.database import postgres_connection
+    from problems.generator_stream import generate_stream_problems
+    
+    logger.info("[SCHEDULER] Generating Stream problems...")
+    with postgres_connection() as pg:
+        generate_stream_problems(today, pg)
+    db_log(
+        category=LogCategory.PROBLEM_GENERATION,
+        message=f"Stream 문제 생성 완료: {today}",
+        level=LogLevel.INFO,
+        source="scheduler"
+    )
+
+
+async def run_weekday_generation():
     """월~금 새벽 1:00 실행: PA 문제, Stream 문제, PA 데이터 생성"""
     today = date.today()
     weekday = today.weekday()  # 0=월, 6=일
@@ -122,7 +191,8 @@ def run_weekday_generation():
     
     logger.info(f"[SCHEDULER] Starting weekday generation for {today} (weekday={weekday})")
     
-    db_log(
+    await asyncio.to_thread(
+        db_log,
         category=LogCategory.SCHEDULER,
         message=f"평일 문제/데이터 생성 시작: {today}",
         level=LogLevel.INFO,
@@ -130,49 +200,20 @@ def run_weekday_generation():
     )
     
     try:
-        from engine.postgres_engine import PostgresEngine
-        from config.db import PostgresEnv
-        
-        pg = PostgresEngine(PostgresEnv().dsn())
-        
-        # 1. PA 문제 생성
-        pa_problem_path = f"problems/daily/{today}.json"
-        if not os.path.exists(pa_problem_path):
-            logger.info("[SCHEDULER] Generating PA problems...")
-            from problems.generator import generate as gen_pa_problems
-            gen_pa_problems(today, pg)
-            db_log(
-                category=LogCategory.PROBLEM_GENERATION,
-                message=f"PA 문제 생성 완료: {today}",
-                level=LogLevel.INFO,
-                source="scheduler"
-            )
-        else:
-            logger.info(f"[SCHEDULER] PA problems already exist: {pa_problem_path}")
-        
-        # 2. Stream 문제 생성
-        stream_problem_path = f"problems/daily/stream_{today}.json"
-        if not os.path.exists(stream_problem_path):
-            logger.info("[SCHEDULER] Generating Stream problems...")
-            from problems.generator_stream import generate_stream_problems
-            generate_stream_problems(today, pg)
-            db_log(
-                category=LogCategory.PROBLEM_GENERATION,
-                message=f"Stream 문제 생성 완료: {today}",
-                level=LogLevel.INFO,
-                source="scheduler"
-            )
-        else:
-            logger.info(f"[SCHEDULER] Stream problems already exist: {stream_problem_path}")
+        # 1. PA 문제 / 2. Stream 문제 생성 - 서로 독립적이므로 동시에 (Gemini 대기 시간 중첩)
+        await asyncio.gather(
+            asyncio.to_thread(_generate_pa_problems, today),
+            asyncio.to_thread(_generate_stream_problems, today),
+        )
         
         # 3. PA 데이터 생성 (TODO: 실제 PA 데이터 생성 로직)
         logger.info("[SCHEDULER] PA data generation would run here (if implemented)")
-        
-        pg.close()
+        invalidate_data_caches()
         
         last_run_times["weekday_job"] = datetime.now()
         
-        db_log(
+        await asyncio.to_thread(
+            db_log,
             category=LogCategory.SCHEDULER,
             message=f"평일 문제/데이터 생성 완료: {today}",
             level=LogLevel.INFO,
@@ -183,7 +224,8 @@ def run_weekday_generation():
     except Exception as e:
         error_msg = f"평일 생성 실패: {str(e)}"
         logger.error(f"[SCHEDULER] {error_msg}")
-        db_log(
+        await asyncio.to_thread(
+            db_log,
             category=LogCategory.SCHEDULER,
             message=error_msg,
             level=LogLevel.ERROR,
@@ -191,6 +233,80 @@ def run_weekday_generation():
         )
 
 
+def _submit_batch(today: date) -> str | None:
+    from backend.services.database import postgres_connection
+    from problems.batch import submit_daily_batch
+    
+    with postgres_connection() as pg:
+        return submit_daily_batch(today, pg)
+
+
+async def submit_weekday_batch():
+    """월~금 새벽 1:00 실행: 문제 생성 요청을 Batch로 제출 (실패 시 동기 생성)"""
+    if not BATCH_ENABLED:
+        await run_weekday_generation()
+        return
+    
+    today = date.today()
+    if today.weekday() >= 5:
+        logger.info(f"[SCHEDULER] Skipping weekday batch on weekend: {today}")
+        return
+    
+    try:
+        batch_name = await asyncio.to_thread(_submit_batch, today)
+        
+        if batch_name:
+            await asyncio.to_thread(
+                db_log,
+                category=LogCategory.PROBLEM_GENERATION,
+                message=f"문제 생성 Batch 제출: {today} ({batch_name})",
+                level=LogLevel.INFO,
+                source="scheduler"
+            )
+        last_run_times["weekday_job"] = datetime.now()
+    except Exception as e:
+        logger.error(f"[SCHEDULER] Batch submit failed, falling back to sync generation: {e}")
+        await run_weekday_generation()
+
+
+def _collect_batch() -> str:
+    from backend.services.database import postgres_connection
+    from problems.batch import collect_daily_batch, cancel_daily_batch
+    
+    with postgres_connection() as pg:
+        status = collect_daily_batch(pg)
+    if status == "pending":
+        cancel_daily_batch()
+    return status
+
+
+async def collect_weekday_batch():
+    """월~금 KST 7:00 실행: Batch 결과 수집 (미완료/실패 시 동기 생성으로 대체)"""
+    if not BATCH_ENABLED:
+        return
+    
+    try:
+        status = await asyncio.to_thread(_collect_batch)
+        
+        last_run_times["weekday_collect"] = datetime.now()
+        if status == "done":
+            invalidate_data_caches()
+            await asyncio.to_thread(
+                db_log,
+                category=LogCategory.PROBLEM_GENERATION,
+                message=f"Batch 문제 수집 완료: {date.today()}",
+                level=LogLevel.INFO,
+                source="scheduler"
+            )
+            return
+        if status in ("pending", "failed"):
+            logger.warning(f"[SCHEDULER] Batch {status}, falling back to sync generation")
+            await run_weekday_generation()
+    except Exception as e:
+        logger.error(f"[SCHEDULER] Batch collect failed, falling back to sync generation: {e}")
+        await run_weekday_generation()
+
+
 def run_sunday_generation():
     """일요일 새벽 1:00 실행: Stream 데이터 생성"""
     today = date.today()
@@ -213,6 +329,7 @@ def run_sunday_generation():
     try:
         # Stream 데이터 생성 (TODO: 실제 Stream 데이터 생성 로직)
         logger.info("[SCHEDULER] Stream data generation would run here (if implemented)")
+        invalidate_data_caches()
         
         last_run_times["sunday_job"] = datetime.now()
         
@@ -268,13 +385,22 @@ def start_scheduler():
     # KST 월요일 1:00 = UTC 일요일 16:00, 따라서 UTC 기준으로는 일~목
     # APScheduler: 0=월, 6=일이므로 sun-thu = 6,0,1,2,3
     scheduler.add_job(
-        run_weekday_generation,
+        submit_weekday_batch,
         CronTrigger(hour=16, minute=0, day_of_week='6,0,1,2,3'),  # UTC 일~목 = KST 월~금
         id="weekday_generation",
         name="평일 문제/데이터 생성 (월~금 KST 1:00)",
         replace_existing=True
     )
     
+    # 1-1. 평일 Batch 결과 수집: 월~금 KST 7:00 (= UTC 전날 22:00)
+    scheduler.add_job(
+        collect_weekday_batch,
+        CronTrigger(hour=22, minute=0, day_of_week='6,0,1,2,3'),
+        id="weekday_collect",
+        name="평일 Batch 문제 수집 (월~금 KST 7:00)",
+        replace_existing=True
+    )
+    
     # 2. 일요일 작업: KST 1:00 (= UTC 토요일 16:00)
     scheduler.add_job(
         run_sunday_generation,
@@ -296,6 +422,7 @@ def start_scheduler():
     scheduler.start()
     logger.info("[SCHEDULER] Started with new schedule:")
     logger.info("  - 평일 문제/데이터: 월~금 KST 1:00 (UTC 전날 16:00)")
+    logger.info("  - 평일 Batch 수집: 월~금 KST 7:00 (UTC 전날 22:00)")
     logger.info("  - 일요일 Stream: 일 KST 1:00 (UTC 토 16:00)")
     logger.info("  - 데이터 정리: 매일 KST 4:00 (UTC 전날 19:00)")
     
@@ -306,10 +433,15 @@ def start_scheduler():
         source="scheduler"
     )
     
-    # 시작 시 오늘 작업 체크 (평일인 경우)
+    # 시작 시 오늘 작업 체크 (평일인 경우) - 앱 기동을 막지 않도록 즉시 실행 작업으로 등록
     today = date.today()
     if today.weekday() < 5:  # 평일
-        run_weekday_generation()
+        scheduler.add_job(
+            run_weekday_generation,
+            id="startup_generation",
+            name="시작 시 오늘 문제 확인",
+            replace_existing=True
+        )
 
 
 def stop_scheduler():
@@ -1,38 +1,162 @@
 # backend/services/database.py
 """데이터베이스 연결 서비스"""
+import asyncio
+import os
+import threading
 from contextlib import contextmanager
-from typing import Generator
+from typing import Generator, Optional
+
+import psycopg2
+from psycopg2.pool import PoolError, ThreadedConnectionPool
+import duckdb
 
 from engine.postgres_engine import PostgresEngine
 from engine.duckdb_engine import DuckDBEngine
 from config.db import PostgresEnv, get_duckdb_path
+from common.logging import get_logger
+
+logger = get_logger(__name__)
+
+# PostgreSQL 커넥션 풀 크기
+PG_POOL_MIN = int(os.getenv("PG_POOL_MIN", "2"))
+PG_POOL_MAX = int(os.getenv("PG_POOL_MAX", "20"))
+# 풀이 가득 찼을 때 연결 반납을 기다리는 최대 시간 (초)
+PG_POOL_TIMEOUT = float(os.getenv("PG_POOL_TIMEOUT", "30"))
+
+# 사용자 SQL 문장 타임아웃 (ms)
+USER_SQL_TIMEOUT_MS = int(os.getenv("USER_SQL_TIMEOUT_MS", "5000"))
+
+_pg_pool: Optional[ThreadedConnectionPool] = None
+_pg_pool_lock = threading.Lock()
+# ThreadedConnectionPool.getconn()은 가득 차면 기다리지 않고 PoolError를 던지므로 대여 수를 먼저 제한
+_pg_pool_slots = threading.BoundedSemaphore(PG_POOL_MAX)
+
+# 프로세스 전역 DuckDB 연결 (요청마다 파일 열기/카탈로그 로드를 반복하지 않음)
+_duck_conn: Optional[duckdb.DuckDBPyConnection] = None
+_duck_lock = threading.Lock()
+
+
+def get_pg_pool() -> ThreadedConnectionPool:
+    """프로세스 전역 PostgreSQL 커넥션 풀 (최초 사용 시 생성)"""
+    global _pg_pool
+    if _pg_pool is None:
+        with _pg_pool_lock:
+            if _pg_pool is None:
+                _pg_pool = ThreadedConnectionPool(
+                    minconn=PG_POOL_MIN,
+                    maxconn=PG_POOL_MAX,
+                    dsn=PostgresEnv().dsn(),
+                )
+    return _pg_pool
+
+
+def _checkout_pg_connection(pool: ThreadedConnectionPool):
+    """풀에서 연결 획득 - 끊어진 연결은 폐기 후 재연결 (pre-ping)"""
+    conn = pool.getconn()
+    try:
+        if conn.closed:
+            raise psycopg2.InterfaceError("connection already closed")
+        with conn.cursor() as cur:
+            cur.execute("SELECT 1")
+    except psycopg2.Error:
+        pool.putconn(conn, close=True)
+        conn = pool.getconn()
+    return conn
+
+
+def get_duckdb_conn() -> duckdb.DuckDBPyConnection:
+    """프로세스 전역 DuckDB 연결 (최초 사용 시 생성 + 스키마 초기화)"""
+    global _duck_conn
+    if _duck_conn is None:
+        with _duck_lock:
+            if _duck_conn is None:
+                _duck_conn = DuckDBEngine(get_duckdb_path()).conn
+    return _duck_conn
 
 
 def get_postgres() -> PostgresEngine:
-    """PostgreSQL 연결 생성"""
+    """PostgreSQL 연결 생성 (풀을 거치지 않는 단독 연결)"""
     return PostgresEngine(PostgresEnv().dsn())
 
 
 def get_duckdb() -> DuckDBEngine:
-    """DuckDB 연결 생성"""
+    """DuckDB 연결 생성 (공유 연결을 거치지 않는 단독 연결)"""
     return DuckDBEngine(get_duckdb_path())
 
 
 @contextmanager
 def postgres_connection() -> Generator[PostgresEngine, None, None]:
-    """PostgreSQL 연결 컨텍스트 매니저"""
-    pg = get_postgres()
+    """PostgreSQL 연결 컨텍스트 매니저 (커넥션 풀에서 대여/반납, 가득 차면 반납까지 대기)"""
+    if not _pg_pool_slots.acquire(timeout=PG_POOL_TIMEOUT):
+        raise PoolError(f"connection pool exhausted (waited {PG_POOL_TIMEOUT}s)")
     try:
-        yield pg
+        pool = get_pg_pool()
+        conn = _checkout_pg_connection(pool)
+        try:
+            yield PostgresEngine(conn=conn)
+        finally:
+            pool.putconn(conn, close=bool(conn.closed))
     finally:
-        pg.close()
+        _pg_pool_slots.release()
+
+
+@contextmanager
+def user_sql_connection(timeout_ms: int = USER_SQL_TIMEOUT_MS) -> Generator[PostgresEngine, None, None]:
+    """
+    사용자 SQL 실행용 연결 - 읽기 전용 트랜잭션 + 문장 타임아웃
+    - 쓰기 문장은 DB 단에서 거부 (키워드 검사 우회 대비)
+    - 폭주 쿼리가 풀 연결/워커를 오래 붙잡지 않도록 timeout_ms 후 취소
+    - 블록 종료 시 항상 ROLLBACK (SET LOCAL 설정도 함께 해제)
+    """
+    with postgres_connection() as pg:
+        pg.execute("BEGIN READ ONLY")
+        try:
+            pg.execute(f"SET LOCAL statement_timeout = {int(timeout_ms)}")
+            yield pg
+        finally:
+            try:
+                pg.execute("ROLLBACK")
+            except psycopg2.Error:
+                # 트랜잭션이 남은 연결은 풀에 돌려보내지 않음
+                pg.conn.close()
 
 
 @contextmanager
 def duckdb_connection() -> Generator[DuckDBEngine, None, None]:
-    """DuckDB 연결 컨텍스트 매니저"""
-    duck = get_duckdb()
+    """DuckDB 연결 컨텍스트 매니저 (공유 연결의 스레드별 cursor 사용)"""
+    cursor = get_duckdb_conn().cursor()
     try:
-        yield duck
+        yield DuckDBEngine(get_duckdb_path(), conn=cursor)
     finally:
-        duck.close()
+        cursor.close()
+
+
+async def warm_postgres_pool() -> None:
+    """앱 시작 시 최소 연결 수만큼 미리 연결 (첫 요청의 핸드셰이크 비용 제거)"""
+    def warm_one():
+        with postgres_connection():
+            pass
+
+    try:
+        await asyncio.gather(*[asyncio.to_thread(warm_one) for _ in range(PG_POOL_MIN)])
+        logger.info(f"PostgreSQL pool warmed (min={PG_POOL_MIN}, max={PG_POOL_MAX})")
+    except Exception as e:
+        logger.warning(f"PostgreSQL pool warm-up failed: {e}")
+
+
+def close_postgres_pool() -> None:
+    """커넥션 풀 종료"""
+    global _pg_pool
+    with _pg_pool_lock:
+        if _pg_pool is not None:
+            _pg_pool.closeall()
+            _pg_pool = None
+
+
+def close_duckdb() -> None:
+    """공유 DuckDB 연결 종료"""
+    global _duck_conn
+    with _duck_lock:
+        if _duck_conn is not None:
+            _duck_conn.close()
+            _duck_conn = None
@@ -111,9 +111,8 @@ def get_logs(
                 LIMIT %s
             """, params)
             
-            logs = []
-            for _, row in df.iterrows():
-                logs.append({
+            return [
+                {
                     "id": int(row["id"]),
                     "category": row["category"],
                     "level": row["level"],
@@ -122,8 +121,9 @@ def get_logs(
                     "user_id": row["user_id"],
                     "extra_data": row["extra_data"],
                     "created_at": row["created_at"].isoformat() if row["created_at"] else None
-                })
-            return logs
+                }
+                for row in df.to_dict("records")
+            ]
     except Exception as e:
         logger.error(f"Failed to get logs: {e}")
         return []
@@ -1,15 +1,19 @@
 # backend/services/grading_service.py
 """채점 서비스 - grading 스키마 테이블 비교 방식"""
+import asyncio
 import time
-import json
 from datetime import date, datetime
 from pathlib import Path
 from typing import Optional
+import numpy as np
 import pandas as pd
+from pandas.api.types import is_datetime64_any_dtype
 
-from backend.services.database import postgres_connection
+from backend.services.database import postgres_connection, user_sql_connection
 from backend.schemas.submission import SubmitResponse
 from backend.services.db_logger import db_log, LogCategory, LogLevel
+from backend.services.submission_queue import enqueue_submission
+from backend.services.problem_service import load_problem_file
 
 GRADING_SCHEMA = "grading"
 
@@ -35,7 +39,7 @@ def load_problem(problem_id: str, data_type: str) -> Optional[dict]:
             continue
         
         try:
-            problems = json.loads(path.read_text(encoding="utf-8"))
+            problems = load_problem_file(path)
             for p in problems:
                 if p.get("problem_id") == problem_id:
                     return p
@@ -45,6 +49,44 @@ def load_problem(problem_id: str, data_type: str) -> Optional[dict]:
     return None
 
 
+def _canonicalize_columns(df: pd.DataFrame) -> tuple[pd.DataFrame, np.ndarray]:
+    """컬럼명을 소문자로 바꾸고 이름순으로 재배열한 새 DataFrame과 컬럼 배열 반환"""
+    lowered = np.char.lower(df.columns.to_numpy(dtype=str))
+    order = np.argsort(lowered, kind="stable")
+    canonical = df.iloc[:, order]
+    canonical.columns = lowered[order]
+    return canonical, lowered[order]
+
+
+def _align_dtypes(user_df: pd.DataFrame, expected_df: pd.DataFrame) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    dtype이 다른 컬럼만 비교 가능한 타입으로 맞춤 (같으면 그대로 반환)
+    - 숫자 vs 숫자(int/float/Decimal 문자열 등): float64
+    - 날짜 vs 문자열(JSON isoformat): datetime64
+    """
+    mismatched = [
+        i for i, (u, e) in enumerate(zip(user_df.dtypes, expected_df.dtypes)) if u != e
+    ]
+    if not mismatched:
+        return user_df, expected_df
+    
+    user_df = user_df.copy()
+    expected_df = expected_df.copy()
+    for i in mismatched:
+        u_col, e_col = user_df.iloc[:, i], expected_df.iloc[:, i]
+        try:
+            if is_datetime64_any_dtype(u_col) or is_datetime64_any_dtype(e_col):
+                u_col, e_col = pd.to_datetime(u_col), pd.to_datetime(e_col)
+            else:
+                u_col = pd.to_numeric(u_col).astype("float64")
+                e_col = pd.to_numeric(e_col).astype("float64")
+        except (ValueError, TypeError):
+            continue  # 변환 불가 컬럼은 원래 값으로 비교
+        user_df.isetitem(i, u_col)
+        expected_df.isetitem(i, e_col)
+    return user_df, expected_df
+
+
 def compare_results(user_df: pd.DataFrame, expected_df: pd.DataFrame, sort_keys: list = None) -> tuple[bool, str]:
     """사용자 결과와 정답 결과 비교 (정렬 키 사용)"""
     # 컬럼 수 확인
@@ -55,12 +97,14 @@ def compare_results(user_df: pd.DataFrame, expected_df: pd.DataFrame, sort_keys:
     if len(user_df) != len(expected_df):
         return False, f"행 수가 다릅니다. (제출: {len(user_df)}, 정답: {len(expected_df)})"
     
+    # 컬럼명 정규화: 소문자 + 이름순 정렬을 한 번에 (입력 DataFrame은 변경하지 않음)
+    user_df, user_cols = _canonicalize_columns(user_df)
+    expected_df, expected_cols = _canonicalize_columns(expected_df)
+    
     # 컬럼명 확인 (순서 무관, 대소문자 무관)
-    user_cols = set(c.lower() for c in user_df.columns)
-    expected_cols = set(c.lower() for c in expected_df.columns)
-    if user_cols != expected_cols:
-        missing = expected_cols - user_cols
-        extra = user_cols - expected_cols
+    if not np.array_equal(user_cols, expected_cols):
+        missing = set(expected_cols) - set(user_cols)
+        extra = set(user_cols) - set(expected_cols)
         msg = "컬럼명이 다릅니다."
         if missing:
             msg += f" 누락: {missing}"
@@ -68,11 +112,22 @@ def compare_results(user_df: pd.DataFrame, expected_df: pd.DataFrame, sort_keys:
             msg += f" 추가: {extra}"
         return False, msg
     
-    # 컬럼명 정규화 (소문자)
-    user_df.columns = [c.lower() for c in user_df.columns]
-    expected_df.columns = [c.lower() for c in expected_df.columns]
+    # dtype 차이(int vs float, 날짜 vs 문자열) 보정
+    user_df, expected_df = _align_dtypes(user_df, expected_df)
     
-    # 정렬 후 비교
+    # 행 해시 multiset 비교 (정렬/복사 없이 O(n)) - 일치하면 바로 정답
+    # object 컬럼은 문자열로 변환 후 해싱되므로('1' == 1) 같은 비-object dtype일 때만 신뢰
+    common_cols = user_cols.tolist()
+    hashable = all(
+        u == e and u != object for u, e in zip(user_df.dtypes, expected_df.dtypes)
+    )
+    if hashable:
+        user_hash = np.sort(pd.util.hash_pandas_object(user_df, index=False).to_numpy())
+        expected_hash = np.sort(pd.util.hash_pandas_object(expected_df, index=False).to_numpy())
+        if np.array_equal(user_hash, expected_hash):
+            return True, "정답입니다! 🎉"
+    
+    # 정렬 후 비교 (해시 불일치 시 차이점 메시지 생성용)
     try:
         # sort_keys가 있으면 사용, 없으면 모든 컬럼으로 정렬
         if sort_keys:
@@ -87,15 +142,11 @@ def compare_results(user_df: pd.DataFrame, expected_df: pd.DataFrame, sort_keys:
             user_sorted = user_df.reset_index(drop=True)
             expected_sorted = expected_df.reset_index(drop=True)
         
-        # 같은 컬럼 순서로 정렬
-        common_cols = sorted(user_sorted.columns)
-        user_sorted = user_sorted[common_cols]
-        expected_sorted = expected_sorted[common_cols]
-        
-        # 값 비교
-        if user_sorted.equals(expected_sorted):
+        # 값 비교 (dtype 무시, 부동소수점 오차 허용)
+        try:
+            pd.testing.assert_frame_equal(user_sorted, expected_sorted, check_dtype=False)
             return True, "정답입니다! 🎉"
-        else:
+        except AssertionError:
             # 디버깅을 위해 첫 번째 차이점 찾기
             for i in range(min(len(user_sorted), len(expected_sorted))):
                 for col in common_cols:
@@ -110,7 +161,19 @@ def compare_results(user_df: pd.DataFrame, expected_df: pd.DataFrame, sort_keys:
         return False, f"비교 오류: {str(e)}"
 
 
-def grade_submission(
+def _fetch_df(sql: str) -> pd.DataFrame:
+    """풀에서 연결을 빌려 쿼리 실행 (스레드에서 호출)"""
+    with postgres_connection() as pg:
+        return pg.fetch_df(sql)
+
+
+def _fetch_user_df(sql: str) -> pd.DataFrame:
+    """사용자 SQL 실행 - 읽기 전용 + 타임아웃 (스레드에서 호출)"""
+    with user_sql_connection() as pg:
+        return pg.fetch_df(sql)
+
+
+async def grade_submission(
     problem_id: str,
     sql: str,
     data_type: str = "pa",
@@ -134,33 +197,41 @@ def grade_submission(
         
         sort_keys = problem.get("sort_keys", [])
         expected_result = problem.get("expected_result")
+        user_query = asyncio.to_thread(_fetch_user_df, sql.strip().rstrip(";"))
         
         # 2. 정답 데이터 가져오기
-        with postgres_connection() as pg:
-            # 사용자 SQL 실행
-            user_df = pg.fetch_df(sql.strip().rstrip(";"))
-            
+        if expected_result and len(expected_result) > 0:
             # JSON에서 expected_result 사용
-            if expected_result and len(expected_result) > 0:
-                expected_df = pd.DataFrame(expected_result)
-            else:
-                # 기존 방식: grading 테이블에서 정답 로드 (하위 호환성)
-                expected_meta = problem.get("expected_meta", {})
-                grading_table = expected_meta.get("grading_table")
-                if not grading_table:
-                    grading_table = f"{GRADING_SCHEMA}.expected_{problem_id}"
-                try:
-                    expected_df = pg.fetch_df(f"SELECT * FROM {grading_table}")
-                except Exception as e:
-                    return SubmitResponse(
-                        is_correct=False,
-                        feedback=f"정답 데이터를 찾을 수 없습니다.",
-                        execution_time_ms=0,
-                        diff=str(e)
-                    )
+            user_df = await user_query
+            expected_df = pd.DataFrame(expected_result)
+        else:
+            # 기존 방식: grading 테이블에서 정답 로드 (하위 호환성)
+            expected_meta = problem.get("expected_meta", {})
+            grading_table = expected_meta.get("grading_table")
+            if not grading_table:
+                grading_table = f"{GRADING_SCHEMA}.expected_{problem_id}"
+            
+            # 사용자 SQL과 정답 테이블 조회를 별도 연결에서 동시 실행
+            user_df, expected_df = await asyncio.gather(
+                user_query,
+                asyncio.to_thread(_fetch_df, f"SELECT * FROM {grading_table}"),
+                return_exceptions=True
+            )
+            # 사용자 SQL 오류가 우선 (아래 except에서 처리)
+            if isinstance(user_df, BaseException):
+                raise user_df
+            if isinstance(expected_df, BaseException):
+                return SubmitResponse(
+                    is_correct=False,
+                    feedback=f"정답 데이터를 찾을 수 없습니다.",
+                    execution_time_ms=0,
+                    diff=str(expected_df)
+                )
         
-        # 3. 결과 비교
-        is_correct, feedback = compare_results(user_df, expected_df, sort_keys)
+        # 3. 결과 비교 (정렬/해시 비교는 CPU 작업이므로 스레드로 위임)
+        is_correct, feedback = await asyncio.to_thread(
+            compare_results, user_df, expected_df, sort_keys
+        )
         
         # 4. 제출 기록 저장 (PostgreSQL)
         save_submission_pg(
@@ -176,12 +247,13 @@ def grade_submission(
         # 5. 정답 시 XP 지급 (문제의 xp_value 또는 기본값 5)
         if is_correct and user_id:
             xp_value = problem.get("xp_value", 5)
-            award_xp(user_id, xp_value)
+            await asyncio.to_thread(award_xp, user_id, xp_value)
             feedback += f" (+{xp_value} XP)"
         
         # 6. 로깅
         result_text = "정답" if is_correct else "오답"
-        db_log(
+        await asyncio.to_thread(
+            db_log,
             category=LogCategory.USER_ACTION,
             message=f"문제 제출: {problem_id} ({result_text})",
             level=LogLevel.INFO,
@@ -241,34 +313,14 @@ def save_submission_pg(
     sql_text: str,
     is_correct: bool,
     feedback: str,
-    user_id: str = None
+    user_id: str = None,
+    difficulty: str = None
 ):
-    """제출 기록 저장 (PostgreSQL)"""
+    """제출 기록 저장 (PostgreSQL) - 백그라운드 큐에 넣고 바로 반환"""
     try:
-        with postgres_connection() as pg:
-            # submissions 테이블 생성 (없으면)
-            pg.execute("""
-                CREATE TABLE IF NOT EXISTS submissions (
-                    id SERIAL PRIMARY KEY,
-                    session_date DATE NOT NULL,
-                    problem_id VARCHAR(100) NOT NULL,
-                    data_type VARCHAR(20) NOT NULL,
-                    sql_text TEXT,
-                    is_correct BOOLEAN,
-                    feedback TEXT,
-                    user_id VARCHAR(100),
-                    xp_earned INTEGER DEFAULT 0,
-                    submitted_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-            # user_id, xp_earned 컬럼 추가 (기존 테이블 호환)
-            pg.execute("ALTER TABLE submissions ADD COLUMN IF NOT EXISTS user_id VARCHAR(100)")
-            pg.execute("ALTER TABLE submissions ADD COLUMN IF NOT EXISTS xp_earned INTEGER DEFAULT 0")
-            
-            pg.execute("""
-                INSERT INTO submissions (session_date, problem_id, data_type, sql_text, is_correct, feedback, user_id)
-                VALUES (%s, %s, %s, %s, %s, %s, %s)
-            """, (session_date, problem_id, data_type, sql_text, is_correct, feedback, user_id))
+        enqueue_submission(
+            (session_date, problem_id, data_type, sql_text, is_correct, feedback, user_id, difficulty)
+        )
     except Exception:
         pass
 
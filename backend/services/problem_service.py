@@ -1,11 +1,15 @@
 # backend/services/problem_service.py
 """문제 관련 서비스"""
 import json
+import os
 import random
 from pathlib import Path
 from datetime import date
+from functools import lru_cache
 from typing import List, Optional, Dict, Any
 
+import pandas as pd
+
 from backend.schemas.problem import Problem, TableSchema, TableColumn
 from backend.services.database import postgres_connection, duckdb_connection
 
@@ -13,6 +17,23 @@ PROBLEM_DIR = Path("problems/daily")
 NUM_PROBLEM_SETS = 3
 
 
+def load_problem_file(path) -> list:
+    """
+    문제 JSON 파일 로드 (경로 + 수정 시각 기준 캐시)
+    - 파일이 다시 쓰이면 mtime이 바뀌어 자동으로 다시 읽음
+    - 반환 리스트/딕셔너리는 캐시와 공유되므로 수정하지 말 것
+    - 파일이 없으면 FileNotFoundError
+    """
+    path = str(path)
+    return _load_problem_json(path, os.stat(path).st_mtime_ns)
+
+
+@lru_cache(maxsize=64)
+def _load_problem_json(path: str, _mtime_ns: int) -> list:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
 def get_user_set_index(user_id: Optional[str], target_date: date, data_type: str) -> int:
     """사용자에게 할당된 문제 세트 인덱스 조회 (없으면 랜덤 할당)"""
     if not user_id:
@@ -81,8 +102,7 @@ def get_problems(
     if not path.exists():
         return []
     
-    with open(path, encoding="utf-8") as f:
-        problems_data = json.load(f)
+    problems_data = load_problem_file(path)
     
     # 완료 상태 조회
     completed_map = get_submission_status(target_date, user_id)
@@ -129,58 +149,58 @@ def get_submission_status(target_date: date, user_id: Optional[str] = None) -> D
                     WHERE session_date = %s AND user_id IS NULL
                 """, [target_date.isoformat()])
             
-            return {row["problem_id"]: row["is_correct"] for _, row in df.iterrows()}
+            return dict(zip(df["problem_id"], df["is_correct"]))
     except Exception:
         return {}
 
 
 def get_table_schema(prefix: str = "pa_") -> List[TableSchema]:
-    """테이블 스키마 조회"""
-    tables = []
-    
+    """테이블 스키마 조회 (일 단위 캐시 - 데이터 갱신 시 clear_schema_cache 호출)"""
     try:
-        with postgres_connection() as pg:
-            # 테이블 목록
-            table_df = pg.fetch_df(f"""
-                SELECT table_name 
-                FROM information_schema.tables 
-                WHERE table_schema = 'public' 
-                AND table_name LIKE '{prefix}%'
-                ORDER BY table_name
-            """)
-            
-            for _, row in table_df.iterrows():
-                tbl_name = row["table_name"]
-                
-                # 컬럼 정보
-                col_df = pg.fetch_df(f"""
-                    SELECT column_name, data_type
-                    FROM information_schema.columns
-                    WHERE table_name = '{tbl_name}' AND table_schema = 'public'
-                    ORDER BY ordinal_position
-                """)
-                
-                columns = [
-                    TableColumn(
-                        column_name=c["column_name"],
-                        data_type=c["data_type"]
-                    )
-                    for _, c in col_df.iterrows()
-                ]
-                
-                # 행 수
-                try:
-                    count_df = pg.fetch_df(f"SELECT COUNT(*) as cnt FROM {tbl_name}")
-                    row_count = int(count_df.iloc[0]["cnt"])
-                except:
-                    row_count = None
-                
-                tables.append(TableSchema(
-                    table_name=tbl_name,
-                    columns=columns,
-                    row_count=row_count
-                ))
+        return list(_load_table_schema(prefix, date.today()))
     except Exception:
-        pass
+        return []
+
+
+def clear_schema_cache():
+    """스키마 캐시 무효화"""
+    _load_table_schema.cache_clear()
+
+
+@lru_cache(maxsize=8)
+def _load_table_schema(prefix: str, _day: date) -> tuple:
+    with postgres_connection() as pg:
+        # 컬럼 정보 + 행 수를 한 번에 조회
+        # 행 수는 planner 통계(reltuples) 추정치 - 테이블 스캔 없음, 통계가 없으면(-1) None
+        col_df = pg.fetch_df("""
+            SELECT
+                col.table_name, col.column_name, col.data_type,
+                CASE WHEN c.reltuples < 0 THEN NULL ELSE c.reltuples::bigint END as row_count
+            FROM information_schema.columns col
+            LEFT JOIN pg_class c
+                ON c.relname = col.table_name
+                AND c.relnamespace = 'public'::regnamespace
+            WHERE col.table_schema = 'public' AND col.table_name LIKE %s
+            ORDER BY col.table_name, col.ordinal_position
+        """, [f"{prefix}%"])
+    
+    columns_by_table: Dict[str, List[TableColumn]] = {}
+    row_counts: Dict[str, Optional[int]] = {}
+    for tbl_name, column_name, data_type, row_count in zip(
+        col_df["table_name"], col_df["column_name"], col_df["data_type"], col_df["row_count"]
+    ):
+        columns_by_table.setdefault(tbl_name, []).append(
+            TableColumn(column_name=column_name, data_type=data_type)
+        )
+        row_counts[tbl_name] = None if pd.isna(row_count) else int(row_count)
+    
+    tables = [
+        TableSchema(
+            table_name=tbl_name,
+            columns=columns,
+            row_count=row_counts[tbl_name]
+        )
+        for tbl_name, columns in columns_by_table.items()
+    ]
     
-    return tables
+    return tuple(tables)
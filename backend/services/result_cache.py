@@ -0,0 +1,97 @@
+# backend/services/result_cache.py
+"""SQL 실행 결과 단기 캐시 (연습 모드 채점용)
+- 같은 정답 SQL / 같은 오답 재제출은 DB를 다시 조회하지 않음
+- 문제/데이터 갱신 시 clear_result_cache()로 무효화
+"""
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
+import pandas as pd
+
+from backend.services.database import user_sql_connection
+
+RESULT_CACHE_MAXSIZE = 1024
+RESULT_CACHE_TTL = 300  # 초
+RESULT_CACHE_MAX_BYTES = 64 * 1024 * 1024  # 전체 캐시 메모리 상한
+RESULT_CACHE_MAX_ENTRY_BYTES = 4 * 1024 * 1024  # 이보다 큰 결과는 캐시하지 않음
+RESULT_CACHE_MAX_ROWS = 10_000  # 메모리 측정 전 행 수로 먼저 거름
+
+# key -> (만료 시각, DataFrame, 크기)
+_cache: "OrderedDict[bytes, tuple[float, pd.DataFrame, int]]" = OrderedDict()
+_total_bytes = 0
+_lock = threading.Lock()
+
+
+def _normalize_sql(sql: str) -> str:
+    # 문자열 리터럴 대소문자가 결과에 영향을 주므로 소문자 변환은 하지 않음
+    return sql.strip().rstrip(";").strip()
+
+
+def _cache_key(sql: str, data_type: str) -> bytes:
+    raw = _normalize_sql(sql).encode("utf-8") + b"\x00" + data_type.encode("utf-8")
+    return hashlib.blake2b(raw, digest_size=16).digest()
+
+
+def _get(key: bytes) -> Optional[pd.DataFrame]:
+    with _lock:
+        entry = _cache.get(key)
+        if entry is None:
+            return None
+        expires_at, df, _ = entry
+        if expires_at < time.monotonic():
+            _evict(key)
+            return None
+        _cache.move_to_end(key)
+        return df
+
+
+def _evict(key: bytes):
+    global _total_bytes
+    _, _, nbytes = _cache.pop(key)
+    _total_bytes -= nbytes
+
+
+def _put(key: bytes, df: pd.DataFrame):
+    """결과 저장 - 큰 결과는 건너뛰고, 개수/전체 바이트 상한을 넘으면 오래된 것부터 제거"""
+    global _total_bytes
+    if len(df) > RESULT_CACHE_MAX_ROWS:
+        return
+    nbytes = int(df.memory_usage(deep=True).sum())
+    if nbytes > RESULT_CACHE_MAX_ENTRY_BYTES:
+        return
+    with _lock:
+        if key in _cache:
+            _evict(key)
+        _cache[key] = (time.monotonic() + RESULT_CACHE_TTL, df, nbytes)
+        _total_bytes += nbytes
+        while len(_cache) > RESULT_CACHE_MAXSIZE or _total_bytes > RESULT_CACHE_MAX_BYTES:
+            _evict(next(iter(_cache)))
+
+
+def clear_result_cache():
+    """캐시 전체 무효화"""
+    global _total_bytes
+    with _lock:
+        _cache.clear()
+        _total_bytes = 0
+
+
+def execute_sql_cached(sql: str, data_type: str = "pa") -> dict:
+    """
+    SQL 실행 (캐시 우선)
+    반환: {"success": True, "data": DataFrame} 또는 {"success": False, "error": str}
+    """
+    key = _cache_key(sql, data_type)
+    df = _get(key)
+    if df is None:
+        try:
+            with user_sql_connection() as pg:
+                df = pg.fetch_df(_normalize_sql(sql))
+        except Exception as e:
+            return {"success": False, "error": str(e)}
+        _put(key, df)
+    # 호출 측에서 컬럼명을 바꿀 수 있으므로 얕은 복사본 반환 (데이터 복사 없음)
+    return {"success": True, "data": df.copy(deep=False)}
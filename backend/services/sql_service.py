@@ -4,7 +4,7 @@ import time
 import re
 from typing import Tuple, Optional, List, Dict, Any
 
-from backend.services.database import postgres_connection
+from backend.services.database import user_sql_connection
 
 
 # 허용되지 않는 SQL 키워드
@@ -13,14 +13,18 @@ DANGEROUS_KEYWORDS = [
     "TRUNCATE", "GRANT", "REVOKE", "EXEC", "EXECUTE"
 ]
 
+# 선두 키워드 검사용 정규식 (대소문자 무시, 원본 문자열에 바로 매칭)
+_DANGEROUS = re.compile(
+    r"^\s*(" + "|".join(DANGEROUS_KEYWORDS) + r")\b",
+    re.IGNORECASE
+)
+
 
 def is_safe_sql(sql: str) -> Tuple[bool, Optional[str]]:
     """SQL 안전성 검사"""
-    clean = sql.strip().upper()
-    
-    for keyword in DANGEROUS_KEYWORDS:
-        if clean.startswith(keyword):
-            return False, f"{keyword} 문은 실행할 수 없습니다."
+    match = _DANGEROUS.match(sql)
+    if match:
+        return False, f"{match.group(1).upper()} 문은 실행할 수 없습니다."
     
     # 세미콜론으로 구분된 다중 쿼리 방지
     statements = [s.strip() for s in sql.split(";") if s.strip()]
@@ -30,6 +34,12 @@ def is_safe_sql(sql: str) -> Tuple[bool, Optional[str]]:
     return True, None
 
 
+def wrap_with_limit(sql: str, limit: int) -> str:
+    """사용자 SQL을 서브쿼리로 감싸 결과 행 수 제한 (끝의 주석이 괄호를 먹지 않도록 줄바꿈)"""
+    query = sql.strip().rstrip(";")
+    return f"SELECT * FROM (\n{query}\n) AS _q LIMIT {int(limit)}"
+
+
 def execute_sql(
     sql: str,
     limit: int = 100
@@ -45,17 +55,15 @@ def execute_sql(
     if not is_safe:
         return None, None, error_msg, 0
     
-    # 쿼리 정리
-    query = sql.strip().rstrip(";")
-    
-    # LIMIT 자동 추가
-    if "LIMIT" not in query.upper():
-        query = f"{query} LIMIT {limit}"
+    # 쿼리 정리 후 항상 바깥에서 LIMIT 적용
+    # - 사용자 쿼리에 LIMIT이 있어도 (서브쿼리/문자열 포함) 전송 행 수 상한 보장
+    # - 플래너가 첫 n행만 필요한 계획을 선택할 수 있음
+    query = wrap_with_limit(sql, limit)
     
     try:
         start = time.time()
         
-        with postgres_connection() as pg:
+        with user_sql_connection() as pg:
             df = pg.fetch_df(query)
         
         elapsed = (time.time() - start) * 1000  # ms
@@ -1,40 +1,95 @@
 # backend/services/stats_service.py
 """통계 서비스 - PostgreSQL submissions 테이블 사용 (개인화)"""
-from datetime import date, timedelta
+from datetime import date
 from typing import List, Optional
 
 from backend.services.database import postgres_connection
 from backend.schemas.submission import UserStats, SubmissionHistory
 
 
+# 난이도별 점수 (정답 1건당)
+_SCORE_CASE = """
+    CASE difficulty
+        WHEN 'easy' THEN 10
+        WHEN 'medium' THEN 25
+        WHEN 'hard' THEN 50
+        ELSE 25
+    END
+"""
+
+# 점수 기반 레벨 체계 (최소 점수, 이름)
+LEVELS = [
+    (0, "🌱 Beginner"),
+    (50, "🌿 Learner"),
+    (150, "🌳 Analyst"),
+    (400, "⭐ Senior"),
+    (800, "🏆 Expert"),
+    (1500, "👑 Master")
+]
+
+
+def _user_filter(user_id: Optional[str]) -> tuple[str, list]:
+    if user_id:
+        return "WHERE user_id = %s", [user_id]
+    return "", []
+
+
+def _fetch_streak(pg, user_id: Optional[str]) -> dict:
+    """
+    최근 30개 제출 날짜로 스트릭 계산 (DB에서 한 번에)
+    - 최신순 rn번째 날짜가 오늘-rn이면 오늘부터 끊김 없이 이어진 날
+    - max: 최근 30개 중 제출한 날 수
+    """
+    where_clause, params = _user_filter(user_id)
+    df = pg.fetch_df(f"""
+        WITH days AS (
+            SELECT DISTINCT session_date::date as day
+            FROM submissions
+            {where_clause}
+            ORDER BY day DESC
+            LIMIT 30
+        ), ranked AS (
+            SELECT day, ROW_NUMBER() OVER (ORDER BY day DESC) - 1 as rn
+            FROM days
+        )
+        SELECT 
+            COUNT(*) FILTER (WHERE day = %s::date - rn::int) as current_streak,
+            COUNT(*) as max_streak
+        FROM ranked
+    """, params + [date.today()])
+    if len(df) == 0:
+        return {"current": 0, "max": 0}
+    return {"current": int(df.iloc[0]["current_streak"]), "max": int(df.iloc[0]["max_streak"])}
+
+
 def get_user_stats(user_id: Optional[str] = None) -> UserStats:
-    """사용자 통계 조회 (개인화)"""
-    streak = get_streak(user_id)
-    level_info = get_level(user_id)
+    """사용자 통계 조회 (개인화) - 연결 1개에서 집계/스트릭 조회"""
+    where_clause, params = _user_filter(user_id)
     
     try:
         with postgres_connection() as pg:
-            if user_id:
-                df = pg.fetch_df("""
-                    SELECT 
-                        COUNT(*) as total,
-                        SUM(CASE WHEN is_correct THEN 1 ELSE 0 END) as correct
-                    FROM submissions
-                    WHERE user_id = %s
-                """, [user_id])
-            else:
-                df = pg.fetch_df("""
-                    SELECT 
-                        COUNT(*) as total,
-                        SUM(CASE WHEN is_correct THEN 1 ELSE 0 END) as correct
-                    FROM submissions
-                """)
+            # 제출 수/정답 수/정답률/점수를 한 번에 집계
+            df = pg.fetch_df(f"""
+                SELECT 
+                    COUNT(*) as total,
+                    COUNT(*) FILTER (WHERE is_correct) as correct,
+                    COALESCE(ROUND(100.0 * COUNT(*) FILTER (WHERE is_correct) / NULLIF(COUNT(*), 0), 1), 0) as accuracy,
+                    COALESCE(SUM(CASE WHEN is_correct THEN {_SCORE_CASE} ELSE 0 END), 0) as total_score
+                FROM submissions
+                {where_clause}
+            """, params)
+            streak = _fetch_streak(pg, user_id)
         
-        total = int(df.iloc[0]["total"]) if len(df) > 0 else 0
-        correct = int(df.iloc[0]["correct"]) if len(df) > 0 and df.iloc[0]["correct"] else 0
-        accuracy = (correct / total * 100) if total > 0 else 0
+        row = df.iloc[0]
+        total = int(row["total"])
+        correct = int(row["correct"])
+        accuracy = float(row["accuracy"])
+        total_score = int(row["total_score"])
     except Exception:
-        total, correct, accuracy = 0, 0, 0
+        total, correct, accuracy, total_score = 0, 0, 0.0, 0
+        streak = {"current": 0, "max": 0}
+    
+    level_info = compute_level(total_score, correct)
     
     return UserStats(
         streak=streak["current"],
@@ -42,7 +97,7 @@ def get_user_stats(user_id: Optional[str] = None) -> UserStats:
         level=level_info["name"],
         total_solved=total,
         correct=level_info.get("correct", correct),
-        accuracy=round(accuracy, 1),
+        accuracy=accuracy,
         next_level_threshold=level_info["next"],
         score=level_info.get("score", 0),
         level_progress=level_info.get("progress", 0)
@@ -53,95 +108,40 @@ def get_streak(user_id: Optional[str] = None) -> dict:
     """연속 출석 스트릭 계산 (개인화)"""
     try:
         with postgres_connection() as pg:
-            if user_id:
-                df = pg.fetch_df("""
-                    SELECT DISTINCT session_date::date as session_date
-                    FROM submissions 
-                    WHERE user_id = %s
-                    ORDER BY session_date DESC 
-                    LIMIT 30
-                """, [user_id])
-            else:
-                df = pg.fetch_df("""
-                    SELECT DISTINCT session_date::date as session_date
-                    FROM submissions 
-                    ORDER BY session_date DESC 
-                    LIMIT 30
-                """)
-        dates = {row["session_date"].isoformat() if hasattr(row["session_date"], 'isoformat') else str(row["session_date"]) for _, row in df.iterrows()}
+            return _fetch_streak(pg, user_id)
     except Exception:
-        dates = set()
-    
-    if not dates:
         return {"current": 0, "max": 0}
-    
-    streak = 0
-    check = date.today()
-    for _ in range(30):
-        if check.isoformat() in dates:
-            streak += 1
-            check -= timedelta(days=1)
-        else:
-            break
-    
-    return {"current": streak, "max": len(dates)}
 
 
 def get_level(user_id: Optional[str] = None) -> dict:
     """점수 기반 레벨 계산 (개인화)"""
+    where_clause, params = _user_filter(user_id)
+    condition = where_clause.replace("WHERE", "AND") if where_clause else ""
     try:
         with postgres_connection() as pg:
-            if user_id:
-                df = pg.fetch_df("""
-                    SELECT 
-                        COALESCE(SUM(
-                            CASE difficulty
-                                WHEN 'easy' THEN 10
-                                WHEN 'medium' THEN 25
-                                WHEN 'hard' THEN 50
-                                ELSE 25
-                            END
-                        ), 0) as total_score,
-                        COUNT(*) as correct_count
-                    FROM submissions
-                    WHERE is_correct = true AND user_id = %s
-                """, [user_id])
-            else:
-                df = pg.fetch_df("""
-                    SELECT 
-                        COALESCE(SUM(
-                            CASE difficulty
-                                WHEN 'easy' THEN 10
-                                WHEN 'medium' THEN 25
-                                WHEN 'hard' THEN 50
-                                ELSE 25
-                            END
-                        ), 0) as total_score,
-                        COUNT(*) as correct_count
-                    FROM submissions
-                    WHERE is_correct = true
-                """)
+            df = pg.fetch_df(f"""
+                SELECT 
+                    COALESCE(SUM({_SCORE_CASE}), 0) as total_score,
+                    COUNT(*) as correct_count
+                FROM submissions
+                WHERE is_correct = true {condition}
+            """, params)
         total_score = int(df.iloc[0]["total_score"]) if len(df) > 0 else 0
         correct_count = int(df.iloc[0]["correct_count"]) if len(df) > 0 else 0
     except Exception:
         total_score = 0
         correct_count = 0
     
-    # 점수 기반 레벨 체계
-    levels = [
-        (0, "🌱 Beginner"),
-        (50, "🌿 Learner"),
-        (150, "🌳 Analyst"),
-        (400, "⭐ Senior"),
-        (800, "🏆 Expert"),
-        (1500, "👑 Master")
-    ]
-    
+    return compute_level(total_score, correct_count)
+
+
+def compute_level(total_score: int, correct_count: int) -> dict:
+    """총 점수로 레벨/다음 기준/진행률 계산"""
     level_name = "🌱 Beginner"
     next_threshold = 50
     current_threshold = 0
     
-    for threshold, name in levels:
+    for threshold, name in LEVELS:
         if total_score >= threshold:
             level_name = name
             current_threshold = threshold
@@ -200,7 +200,7 @@ def get_submission_history(limit: int = 20, data_type: str = None, user_id: Opti
                 feedback=row["feedback"] or "",
                 submitted_at=(row["submitted_at"].isoformat() if hasattr(row["submitted_at"], "isoformat") else str(row["submitted_at"]))
             )
-            for _, row in df.iterrows()
+            for row in df.to_dict("records")
         ]
     except Exception:
         return []
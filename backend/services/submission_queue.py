@@ -0,0 +1,179 @@
+# backend/services/submission_queue.py
+"""제출 기록 비동기 저장 큐
+- 채점 응답 경로에서 INSERT를 분리: 요청은 큐에 넣고 바로 반환
+- 단일 소비자 태스크가 최대 50건 / 500ms 단위로 모아 한 번에 INSERT
+- 이벤트 루프가 없으면 (스크립트 등) 즉시 동기 저장
+"""
+import asyncio
+import threading
+from typing import Optional
+
+from backend.services.database import postgres_connection
+from common.logging import get_logger
+
+logger = get_logger(__name__)
+
+BATCH_SIZE = 50
+FLUSH_INTERVAL = 0.5  # 초
+
+INSERT_SQL = """
+    INSERT INTO submissions (session_date, problem_id, data_type, sql_text, is_correct, feedback, user_id, difficulty)
+    VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+"""
+
+_STOP = object()
+
+_queue: Optional[asyncio.Queue] = None
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_task: Optional[asyncio.Task] = None
+_index_task: Optional[asyncio.Task] = None
+
+_table_ready = False
+_table_lock = threading.Lock()
+
+
+def ensure_submissions_table(pg):
+    """submissions 테이블/컬럼 준비 (프로세스당 1회)"""
+    global _table_ready
+    if _table_ready:
+        return
+    with _table_lock:
+        if _table_ready:
+            return
+        pg.execute("""
+            CREATE TABLE IF NOT EXISTS submissions (
+                id SERIAL PRIMARY KEY,
+                session_date DATE NOT NULL,
+                problem_id VARCHAR(100) NOT NULL,
+                data_type VARCHAR(20) NOT NULL,
+                sql_text TEXT,
+                is_correct BOOLEAN,
+                feedback TEXT,
+                user_id VARCHAR(100),
+                xp_earned INTEGER DEFAULT 0,
+                submitted_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        # user_id, xp_earned, difficulty 컬럼 추가 (기존 테이블 호환)
+        pg.execute("ALTER TABLE submissions ADD COLUMN IF NOT EXISTS user_id VARCHAR(100)")
+        pg.execute("ALTER TABLE submissions ADD COLUMN IF NOT EXISTS xp_earned INTEGER DEFAULT 0")
+        pg.execute("ALTER TABLE submissions ADD COLUMN IF NOT EXISTS difficulty VARCHAR(20)")
+        _table_ready = True
+
+
+# 조회용 인덱스 (이름, 정의) - 삽입 경로와 분리해 앱 시작 시 백그라운드로 생성
+SUBMISSION_INDEXES = [
+    # 리더보드 집계용 부분 인덱스 (정답 제출만, 날짜 포함 → index-only scan)
+    ("idx_submissions_user_correct",
+     "ON submissions (user_id) INCLUDE (session_date) WHERE is_correct"),
+    # 날짜별 제출 상태 조회용 (get_submission_status → index-only scan)
+    ("idx_submissions_date_user",
+     "ON submissions (session_date, user_id) INCLUDE (problem_id, is_correct)"),
+]
+
+
+def ensure_submissions_indexes():
+    """
+    submissions 조회용 인덱스 생성 (CONCURRENTLY, 실패해도 제출 저장에 영향 없음)
+    - 실패로 INVALID 인덱스가 남으면 제거해 다음 기동 때 다시 시도
+    """
+    try:
+        with postgres_connection() as pg:
+            ensure_submissions_table(pg)
+            for name, definition in SUBMISSION_INDEXES:
+                try:
+                    pg.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} {definition}")
+                except Exception as e:
+                    logger.warning(f"Failed to create index {name}: {e}")
+                    invalid = pg.fetch_df("""
+                        SELECT 1 FROM pg_index i
+                        JOIN pg_class c ON c.oid = i.indexrelid
+                        WHERE c.relname = %s AND NOT i.indisvalid
+                    """, [name])
+                    if len(invalid) > 0:
+                        pg.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+    except Exception as e:
+        logger.warning(f"Skipping submissions index setup: {e}")
+
+
+def _insert_rows(rows: list[tuple]):
+    try:
+        with postgres_connection() as pg:
+            try:
+                ensure_submissions_table(pg)
+            except Exception as e:
+                # 스키마 확인이 실패해도 기존 테이블에 그대로 저장 시도
+                logger.warning(f"submissions table check failed, inserting anyway: {e}")
+            pg.execute_many(INSERT_SQL, rows)
+    except Exception as e:
+        logger.error(f"Failed to save {len(rows)} submissions: {e}")
+
+
+async def _drain_submissions():
+    loop = asyncio.get_running_loop()
+    while True:
+        item = await _queue.get()
+        if item is _STOP:
+            return
+        batch = [item]
+        stop = False
+        deadline = loop.time() + FLUSH_INTERVAL
+        while len(batch) < BATCH_SIZE:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                item = await asyncio.wait_for(_queue.get(), timeout)
+            except asyncio.TimeoutError:
+                break
+            if item is _STOP:
+                stop = True
+                break
+            batch.append(item)
+        await asyncio.to_thread(_insert_rows, batch)
+        if stop:
+            return
+
+
+async def start_submission_writer():
+    """앱 시작 시 소비자 태스크 기동 + 조회용 인덱스 백그라운드 생성"""
+    global _queue, _loop, _task, _index_task
+    _queue = asyncio.Queue()
+    _loop = asyncio.get_running_loop()
+    _task = asyncio.create_task(_drain_submissions())
+    _index_task = asyncio.create_task(asyncio.to_thread(ensure_submissions_indexes))
+
+
+async def stop_submission_writer():
+    """앱 종료 시 남은 기록을 모두 저장 후 종료"""
+    global _queue, _loop, _task
+    if _task is None:
+        return
+    await _queue.put(_STOP)
+    await _task
+    # STOP 이후 들어온 기록까지 저장
+    remaining = []
+    while not _queue.empty():
+        item = _queue.get_nowait()
+        if item is not _STOP:
+            remaining.append(item)
+    if remaining:
+        await asyncio.to_thread(_insert_rows, remaining)
+    _queue, _loop, _task = None, None, None
+
+
+def enqueue_submission(row: tuple):
+    """제출 기록 저장 요청 (INSERT_SQL 컬럼 순서의 튜플)"""
+    queue, loop = _queue, _loop
+    if queue is None or loop is None or loop.is_closed():
+        _insert_rows([row])
+        return
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        running = None
+    if running is loop:
+        queue.put_nowait(row)
+    else:
+        # 스레드풀 등 다른 스레드에서 호출된 경우
+        loop.call_soon_threadsafe(queue.put_nowait, row)
@@ -59,6 +59,10 @@ CREATE TABLE IF NOT EXISTS pa_submissions (
     submitted_at TIMESTAMP
 );
 
+-- 날짜별 제출 상태 조회용
+CREATE INDEX IF NOT EXISTS idx_pa_submissions_date_problem
+    ON pa_submissions (session_date, problem_id);
+
 CREATE TABLE IF NOT EXISTS stream_submissions (
     session_date TEXT,
     problem_id TEXT,
@@ -72,7 +76,12 @@ CREATE TABLE IF NOT EXISTS pa_answers (
 """
 
 class DuckDBEngine:
-    def __init__(self, db_path: str | Path):
+    def __init__(self, db_path: str | Path | None = None, conn: duckdb.DuckDBPyConnection | None = None):
+        # conn이 주어지면 (공유 연결의 cursor 등) 재사용 - 스키마는 공유 연결 생성 시 초기화됨
+        if conn is not None:
+            self.db_path = Path(db_path) if db_path is not None else None
+            self.conn = conn
+            return
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         self.conn = duckdb.connect(str(self.db_path))
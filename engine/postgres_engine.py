@@ -6,8 +6,9 @@ import pandas as pd
 from typing import Iterable, Any
 
 class PostgresEngine:
-    def __init__(self, dsn: str):
-        self.conn = psycopg2.connect(dsn)
+    def __init__(self, dsn: str | None = None, conn=None):
+        # conn이 주어지면 (커넥션 풀 등) 기존 연결을 재사용
+        self.conn = conn if conn is not None else psycopg2.connect(dsn)
         self.conn.autocommit = True
 
     def execute(self, sql: str, params: Iterable[Any] | None = None) -> None:
@@ -21,7 +22,14 @@ class PostgresEngine:
             psycopg2.extras.execute_batch(cur, sql, rows, page_size=5000)
 
     def fetch_df(self, sql: str, params: Iterable[Any] | None = None) -> pd.DataFrame:
-        return pd.read_sql_query(sql, self.conn, params=params)
+        # pandas SQL 계층을 거치지 않고 커서 결과로 바로 DataFrame 구성
+        with self.conn.cursor() as cur:
+            cur.execute(sql, params)
+            if cur.description is None:
+                return pd.DataFrame()
+            columns = [d[0] for d in cur.description]
+            rows = cur.fetchall()
+        return pd.DataFrame.from_records(rows, columns=columns, coerce_float=True)
 
     def table_exists(self, table: str) -> bool:
         q = """
@@ -273,6 +273,15 @@ function AdminPage() {
   };
 
 
+  // 테이블 정확한 행 수 (요청한 테이블만)
+  const [exactCounts, setExactCounts] = useState<Record<string, number>>({});
+
+  const loadExactCount = (tableName: string) => {
+    adminApi.exactTableCount(tableName)
+      .then(res => setExactCounts(prev => ({ ...prev, [tableName]: res.data.row_count })))
+      .catch(() => { });
+  };
+
   // API 사용량
   const [apiUsage, setApiUsage] = useState<any>(null);
   const [showApiUsage, setShowApiUsage] = useState(false);
@@ -362,6 +371,18 @@ function AdminPage() {
   };
 
 
+  const refreshSchemaCache = async () => {
+    setLoading(true);
+    setMessage('');
+    try {
+      const res = await adminApi.refreshSchemaCache();
+      setMessage(res.data.message || '완료');
+    } catch (e) {
+      setMessage('오류 발생');
+    }
+    setLoading(false);
+  };
+
   const today = new Date().toISOString().split('T')[0];
 
   return (
@@ -437,6 +458,9 @@ function AdminPage() {
           <button onClick={refreshStatus} disabled={loading}>
             🔃 상태 새로고침
           </button>
+          <button onClick={refreshSchemaCache} disabled={loading}>
+            🗂️ 스키마 캐시 초기화
+          </button>
           <button
             onClick={async () => {
               if (window.confirm('⚠️ 모든 제출 기록이 삭제됩니다. 계속하시겠습니까?')) {
@@ -550,13 +574,22 @@ function AdminPage() {
         {status?.tables?.length > 0 ? (
           <table className="admin-table">
             <thead>
-              <tr><th>테이블</th><th>행 수</th><th>컬럼 수</th></tr>
+              <tr><th>테이블</th><th>행 수 (추정)</th><th>컬럼 수</th></tr>
             </thead>
             <tbody>
               {status.tables.map((t: any) => (
                 <tr key={t.table_name}>
                   <td>{t.table_name}</td>
-                  <td>{t.row_count.toLocaleString()}</td>
+                  <td>
+                    {t.table_name in exactCounts ? (
+                      exactCounts[t.table_name].toLocaleString()
+                    ) : (
+                      <>
+                        ~{t.row_count.toLocaleString()}{' '}
+                        <button onClick={() => loadExactCount(t.table_name)}>정확히</button>
+                      </>
+                    )}
+                  </td>
                   <td>{t.column_count || '-'}</td>
                 </tr>
               ))}
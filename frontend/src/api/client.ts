@@ -65,6 +65,8 @@ export const adminApi = {
         api.post('/admin/generate-problems', { data_type: dataType, force }),
     refreshData: (dataType: string) =>
         api.post('/admin/refresh-data', { data_type: dataType }),
+    refreshSchemaCache: () => api.post('/admin/refresh-schema-cache'),
+    exactTableCount: (tableName: string) => api.get(`/admin/table-count/${tableName}`),
     resetSubmissions: () => api.post('/admin/reset-submissions'),
     datasetVersions: () => api.get('/admin/dataset-versions'),
     schedulerLogs: (lines: number = 50) => api.get('/admin/scheduler-logs', { params: { lines } }),
@@ -1,4 +1,5 @@
 // frontend/src/components/ResultTable.tsx
+import { memo } from 'react';
 import './ResultTable.css';
 
 interface ResultTableProps {
@@ -7,7 +8,7 @@ interface ResultTableProps {
     executionTime?: number;
 }
 
-export function ResultTable({ columns, data, executionTime }: ResultTableProps) {
+export const ResultTable = memo(function ResultTable({ columns, data, executionTime }: ResultTableProps) {
     if (!data.length) {
         return <div className="result-empty">결과가 없습니다.</div>;
     }
@@ -42,7 +43,7 @@ export function ResultTable({ columns, data, executionTime }: ResultTableProps)
             </div>
         </div>
     );
-}
+});
 
 function formatValue(value: any): string {
     if (value === null || value === undefined) return 'NULL';
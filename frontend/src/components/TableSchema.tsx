@@ -1,4 +1,5 @@
 // frontend/src/components/TableSchema.tsx
+import { memo } from 'react';
 import type { TableSchema as Schema } from '../types';
 import './TableSchema.css';
 
@@ -6,7 +7,7 @@ interface TableSchemaProps {
     tables: Schema[];
 }
 
-export function TableSchema({ tables }: TableSchemaProps) {
+export const TableSchema = memo(function TableSchema({ tables }: TableSchemaProps) {
     if (!tables.length) {
         return <div className="schema-empty">테이블이 없습니다.</div>;
     }
@@ -35,4 +36,4 @@ export function TableSchema({ tables }: TableSchemaProps) {
             ))}
         </div>
     );
-}
+});
@@ -1,5 +1,5 @@
 // frontend/src/pages/Workspace.tsx
-import { useEffect, useState, useCallback, useRef } from 'react';
+import { memo, useEffect, useState, useCallback, useRef } from 'react';
 import { SQLEditor } from '../components/SQLEditor';
 import { TableSchema } from '../components/TableSchema';
 import { ResultTable } from '../components/ResultTable';
@@ -17,18 +17,115 @@ function renderMarkdown(text: string) {
     return <span dangerouslySetInnerHTML={{ __html: html }} />;
 }
 
-interface WorkspaceProps {
-    dataType: 'pa' | 'stream';
-}
+const difficultyIcon: Record<string, string> = {
+    easy: '🟢', medium: '🟡', hard: '🔴',
+};
 
 interface CompletedStatus {
     [problemId: string]: { is_correct: boolean; submitted_at: string };
 }
 
-export function Workspace({ dataType }: WorkspaceProps) {
-    const [problems, setProblems] = useState<Problem[]>([]);
-    const [selectedIndex, setSelectedIndex] = useState(0);
-    const [tables, setTables] = useState<Schema[]>([]);
+function statusIcon(status: CompletedStatus[string] | undefined) {
+    if (!status) return '⬜';
+    return status.is_correct ? '✅' : '❌';
+}
+
+// 문제 목록 / 상세는 SQL 입력과 무관하므로 memo로 감싸 키 입력마다 다시 그리지 않음
+interface ProblemListProps {
+    problems: Problem[];
+    selectedIndex: number;
+    completedStatus: CompletedStatus;
+    onSelect: (idx: number) => void;
+}
+
+const ProblemList = memo(function ProblemList({ problems, selectedIndex, completedStatus, onSelect }: ProblemListProps) {
+    return (
+        <div className="problem-list">
+            {problems.map((p, idx) => (
+                <button
+                    key={p.problem_id}
+                    className={`problem-item ${selectedIndex === idx ? 'active' : ''}`}
+                    onClick={() => onSelect(idx)}
+                >
+                    <span className="status">{statusIcon(completedStatus[p.problem_id])}</span>
+                    <span className="num">{idx + 1}번</span>
+                    <span className="difficulty">{difficultyIcon[p.difficulty]}</span>
+                </button>
+            ))}
+        </div>
+    );
+});
+
+interface ProblemDetailProps {
+    problem: Problem;
+    index: number;
+}
+
+const ProblemDetail = memo(function ProblemDetail({ problem, index }: ProblemDetailProps) {
+    return (
+        <div className="problem-detail">
+            <div className="problem-title">
+                <span className="problem-number">문제 {index + 1}</span>
+                <span className="difficulty-badge">
+                    {difficultyIcon[problem.difficulty]} {problem.difficulty}
+                </span>
+            </div>
+
+            {problem.requester && (
+                <div className="slack-message">
+                    <div className="slack-header">
+                        <span className="slack-avatar">👤</span>
+                        <span className="slack-sender">{problem.requester}</span>
+                        <span className="slack-time">오늘 오전 10:30</span>
+                    </div>
+                    <div className="slack-content">
+                        {renderMarkdown(problem.question)}
+                    </div>
+                    {problem.context && (
+                        <div className="slack-context">
+                            💡 {renderMarkdown(problem.context)}
+                        </div>
+                    )}
+                </div>
+            )}
+
+            {problem.expected_columns && (
+                <div className="section">
+                    <div className="section-title">📊 결과 컬럼</div>
+                    <div className="columns-box">
+                        {problem.expected_columns.map((col, i) => (
+                            <code key={i}>{col}</code>
+                        ))}
+                    </div>
+                </div>
+            )}
+
+            {problem.hint && (
+                <details className="hint-section">
+                    <summary>💬 힌트 보기</summary>
+                    <p>{problem.hint}</p>
+                </details>
+            )}
+        </div>
+    );
+});
+
+// SQL 편집기 + 실행/제출/힌트 + 결과 영역
+// sql 상태를 이 컴포넌트 안에 두어 키 입력 시 문제 목록/스키마 등 워크스페이스 전체가 다시 그려지지 않도록 함
+// 문제가 바뀌면 편집 내용/결과만 초기화 (Monaco 편집기는 유지)
+interface EditorPanelProps {
+    problem: Problem | null;
+    tables: Schema[];
+    dataType: 'pa' | 'stream';
+    width: number;
+    editorHeight: number;
+    onEditorHeightChange: (height: number) => void;
+    onSubmitted: (problemId: string, isCorrect: boolean) => void;
+}
+
+const EditorPanel = memo(function EditorPanel({
+    problem, tables, dataType, width, editorHeight, onEditorHeightChange, onSubmitted
+}: EditorPanelProps) {
     const [sql, setSql] = useState('');
     const [result, setResult] = useState<SQLExecuteResponse | null>(null);
     const [submitResult, setSubmitResult] = useState<SubmitResponse | null>(null);
@@ -36,73 +133,16 @@ export function Workspace({ dataType }: WorkspaceProps) {
     const [submitting, setSubmitting] = useState(false);
     const [hinting, setHinting] = useState(false);
     const [hint, setHint] = useState<string | null>(null);
-    const [activeTab, setActiveTab] = useState<'problem' | 'schema'>('problem');
-    const [leftWidth, setLeftWidth] = useState(45);
-    const [editorHeight, setEditorHeight] = useState(600); // 기본 높이 600px
-    const [completedStatus, setCompletedStatus] = useState<CompletedStatus>({});
-    const resizerRef = useRef<HTMLDivElement>(null);
-    const containerRef = useRef<HTMLDivElement>(null);
     const rightPanelRef = useRef<HTMLDivElement>(null);
 
-    const selectedProblem = problems[selectedIndex] || null;
-
-    // 데이터 로드
-    useEffect(() => {
-        async function load() {
-            try {
-                const [problemsRes, schemaRes] = await Promise.all([
-                    problemsApi.list(dataType),
-                    problemsApi.schema(dataType),
-                ]);
-                const newProblems = problemsRes.data.problems;
-                setProblems(newProblems);
-                setTables(schemaRes.data);
-                setSelectedIndex(0);
-                setSubmitResult(null);
-                setResult(null);
-                setHint(null);
-                setSql('');
-
-                // 문제 ID 비교하여 새 문제 세트면 제출 기록 초기화
-                const savedKey = `completed_${dataType}`;
-                const savedProblemIdsKey = `problem_ids_${dataType}`;
-                const currentProblemIds = newProblems.map((p: any) => p.problem_id).join(',');
-                const savedProblemIds = localStorage.getItem(savedProblemIdsKey);
-
-                if (savedProblemIds !== currentProblemIds) {
-                    // 새 문제 세트 - 기존 제출 기록 초기화
-                    localStorage.removeItem(savedKey);
-                    localStorage.setItem(savedProblemIdsKey, currentProblemIds);
-                    setCompletedStatus({});
-                } else {
-                    // 같은 문제 세트 - 저장된 기록 복원
-                    const saved = localStorage.getItem(savedKey);
-                    if (saved) {
-                        try { setCompletedStatus(JSON.parse(saved)); } catch { }
-                    }
-                }
-            } catch (error) {
-                console.error('Failed to load data:', error);
-            }
-        }
-        load();
-    }, [dataType]);
-
-    // Analytics: 페이지 로드 및 문제 선택 추적
-    useEffect(() => {
-        analytics.pageView(dataType === 'pa' ? '/pa-practice' : '/stream', { data_type: dataType });
-    }, [dataType]);
-
+    // 문제 변경 시 편집 내용/결과 초기화
+    const problemId = problem?.problem_id;
     useEffect(() => {
-        if (selectedProblem) {
-            analytics.problemViewed(selectedProblem.problem_id, {
-                difficulty: selectedProblem.difficulty,
-                dataType,
-                isDaily: dataType === 'pa' || dataType === 'stream',
-                topic: selectedProblem.topic
-            });
-        }
-    }, [selectedProblem, dataType]);
+        setSql('');
+        setResult(null);
+        setSubmitResult(null);
+        setHint(null);
+    }, [problemId]);
 
     // SQL 실행
     const handleExecute = useCallback(async () => {
@@ -112,14 +152,14 @@ export function Workspace({ dataType }: WorkspaceProps) {
         setHint(null);
 
         // 첫 실행/타이핑 시 시도로 기록
-        if (selectedProblem) {
-            analytics.problemAttempted(selectedProblem.problem_id, selectedProblem.difficulty);
+        if (problem) {
+            analytics.problemAttempted(problem.problem_id, problem.difficulty);
         }
 
         try {
             const res = await sqlApi.execute(sql);
             setResult(res.data);
-            analytics.sqlExecuted(selectedProblem?.problem_id || 'unknown', {
+            analytics.sqlExecuted(problem?.problem_id || 'unknown', {
                 sql,
                 hasError: !res.data.success,
                 errorMessage: res.data.error,
@@ -127,7 +167,7 @@ export function Workspace({ dataType }: WorkspaceProps) {
             });
         } catch (error: any) {
             setResult({ success: false, error: error.message });
-            analytics.sqlExecuted(selectedProblem?.problem_id || 'unknown', {
+            analytics.sqlExecuted(problem?.problem_id || 'unknown', {
                 sql,
                 hasError: true,
                 errorType: 'runtime',
@@ -136,66 +176,57 @@ export function Workspace({ dataType }: WorkspaceProps) {
             });
         }
         setLoading(false);
-    }, [sql, selectedProblem]);
+    }, [sql, problem]);
 
     // 제출
     const handleSubmit = useCallback(async () => {
-        if (!sql.trim() || !selectedProblem) return;
+        if (!sql.trim() || !problem) return;
         setSubmitting(true);
         setSubmitResult(null);
         setHint(null);
         try {
-            const res = await sqlApi.submit(selectedProblem.problem_id, sql, dataType);
+            const res = await sqlApi.submit(problem.problem_id, sql, dataType);
             setSubmitResult(res.data);
+            onSubmitted(problem.problem_id, res.data.is_correct);
 
-            const newStatus = {
-                ...completedStatus,
-                [selectedProblem.problem_id]: {
-                    is_correct: res.data.is_correct,
-                    submitted_at: new Date().toISOString()
-                }
-            };
-            setCompletedStatus(newStatus);
-            localStorage.setItem(`completed_${dataType}`, JSON.stringify(newStatus));
-
-            analytics.problemSubmitted(selectedProblem.problem_id, {
+            analytics.problemSubmitted(problem.problem_id, {
                 isCorrect: res.data.is_correct,
-                difficulty: selectedProblem.difficulty,
+                difficulty: problem.difficulty,
                 dataType: dataType
             });
         } catch (error: any) {
             setSubmitResult({ is_correct: false, feedback: error.message });
         }
         setSubmitting(false);
-    }, [sql, selectedProblem, completedStatus, dataType, selectedIndex]);
+    }, [sql, problem, dataType, onSubmitted]);
 
     // 힌트 요청
     const handleHint = useCallback(async () => {
-        if (!sql.trim() || !selectedProblem) return;
+        if (!sql.trim() || !problem) return;
         setHinting(true);
         setHint(null);
 
-        analytics.hintRequested(selectedProblem.problem_id, selectedProblem.difficulty, dataType);
+        analytics.hintRequested(problem.problem_id, problem.difficulty, dataType);
 
         try {
-            const res = await sqlApi.hint(selectedProblem.problem_id, sql, dataType);
+            const res = await sqlApi.hint(problem.problem_id, sql, dataType);
             setHint(res.data.hint);
         } catch (error: any) {
             setHint(`힌트 요청 실패: ${error.message}`);
         }
         setHinting(false);
-    }, [sql, selectedProblem, dataType]);
+    }, [sql, problem, dataType]);
 
-    // 좌우 리사이저
-    const handleMouseDown = useCallback((e: React.MouseEvent) => {
+    // 상하 리사이저
+    const handleMouseDownVertical = useCallback((e: React.MouseEvent) => {
         e.preventDefault();
-        const container = containerRef.current;
-        if (!container) return;
+        const rightPanel = rightPanelRef.current;
+        if (!rightPanel) return;
 
         const handleMouseMove = (e: MouseEvent) => {
-            const containerRect = container.getBoundingClientRect();
-            const newWidth = ((e.clientX - containerRect.left) / containerRect.width) * 100;
-            setLeftWidth(Math.min(Math.max(newWidth, 20), 80));
+            const rightPanelRect = rightPanel.getBoundingClientRect();
+            const newHeight = e.clientY - rightPanelRect.top;
+            onEditorHeightChange(Math.min(Math.max(newHeight, 150), rightPanelRect.height - 100));
         };
 
         const handleMouseUp = () => {
@@ -205,18 +236,196 @@ export function Workspace({ dataType }: WorkspaceProps) {
 
         document.addEventListener('mousemove', handleMouseMove);
         document.addEventListener('mouseup', handleMouseUp);
-    }, []);
+    }, [onEditorHeightChange]);
 
-    // 상하 리사이저
-    const handleMouseDownVertical = useCallback((e: React.MouseEvent) => {
+    return (
+        <div className="right-panel" ref={rightPanelRef} style={{ width: `${width}%` }}>
+            <div className="editor-section" style={{ height: `${editorHeight}px` }}>
+                <div className="editor-header">
+                    <span>💻 SQL</span>
+                    <span className="shortcut">Ctrl+Enter로 실행</span>
+                </div>
+                <div className="editor-shell">
+                    <SQLEditor
+                        value={sql}
+                        onChange={(val) => {
+                            setSql(val);
+                            if (problem && val.trim().length > 0) {
+                                analytics.problemAttempted(problem.problem_id, problem.difficulty);
+                            }
+                        }}
+                        onExecute={handleExecute}
+                        height={`${editorHeight - 110}px`} // header(35) + actions(45) + border/padding
+                        tables={tables}
+                    />
+                </div>
+                <div className="editor-actions">
+                    <button onClick={handleExecute} disabled={loading} className="btn-execute">
+                        {loading ? '⏳ 실행 중...' : '▶️ 실행'}
+                    </button>
+                    <div className="spacer" />
+                    <button onClick={handleHint} disabled={hinting || !problem} className="btn-hint">
+                        {hinting ? '💭 생각 중...' : '💡 도움'}
+                    </button>
+                    <button onClick={handleSubmit} disabled={submitting || !problem} className="btn-submit">
+                        {submitting ? '🔄 채점 중...' : '✅ 제출'}
+                    </button>
+                </div>
+            </div>
+
+            <div className="v-resizer" onMouseDown={handleMouseDownVertical} />
+
+            <div className="result-section">
+                <div className="result-header">
+                    <span>📊 실행 결과</span>
+                    {result?.execution_time_ms && (
+                        <span className="exec-time">{result.execution_time_ms.toFixed(0)}ms</span>
+                    )}
+                </div>
+
+                <div className="result-content">
+                    {/* 로딩 상태 */}
+                    {(submitting || hinting) && (
+                        <div className="loading-state">
+                            <div className="loading-spinner" />
+                            <div className="loading-text">
+                                {submitting ? '🤔 채점 중입니다...' : '💭 AI가 힌트를 생성하고 있습니다...'}
+                            </div>
+                        </div>
+                    )}
+
+                    {/* 힌트 */}
+                    {hint && !submitting && !hinting && (
+                        <div className="hint-result">
+                            <div className="hint-title">💡 AI 힌트</div>
+                            <div className="hint-content">{hint}</div>
+                        </div>
+                    )}
+
+                    {/* 제출 결과 */}
+                    {submitResult && !submitting && (
+                        <div className={`submit-result ${submitResult.is_correct ? 'correct' : 'wrong'}`}>
+                            <div className="result-icon">
+                                {submitResult.is_correct ? '✅ 정답입니다!' : '❌ 틀렸습니다'}
+                            </div>
+                            <div className="feedback">{submitResult.feedback}</div>
+                        </div>
+                    )}
+
+                    {/* 쿼리 결과 */}
+                    {result && result.success && result.data && !submitting && !hinting && (
+                        <ResultTable columns={result.columns || []} data={result.data} />
+                    )}
+
+                    {result && !result.success && !submitting && !hinting && (
+                        <div className="error-result">❌ {result.error}</div>
+                    )}
+
+                    {!result && !submitResult && !hint && !submitting && !hinting && (
+                        <div className="empty-result">SQL을 작성하고 실행 버튼을 누르세요</div>
+                    )}
+                </div>
+            </div>
+        </div>
+    );
+});
+
+interface WorkspaceProps {
+    dataType: 'pa' | 'stream';
+}
+
+export function Workspace({ dataType }: WorkspaceProps) {
+    const [problems, setProblems] = useState<Problem[]>([]);
+    const [selectedIndex, setSelectedIndex] = useState(0);
+    const [tables, setTables] = useState<Schema[]>([]);
+    const [activeTab, setActiveTab] = useState<'problem' | 'schema'>('problem');
+    const [leftWidth, setLeftWidth] = useState(45);
+    const [editorHeight, setEditorHeight] = useState(600); // 기본 높이 600px (문제를 바꿔도 유지)
+    const [completedStatus, setCompletedStatus] = useState<CompletedStatus>({});
+    const resizerRef = useRef<HTMLDivElement>(null);
+    const containerRef = useRef<HTMLDivElement>(null);
+
+    const selectedProblem = problems[selectedIndex] || null;
+
+    // 데이터 로드
+    useEffect(() => {
+        async function load() {
+            try {
+                const [problemsRes, schemaRes] = await Promise.all([
+                    problemsApi.list(dataType),
+                    problemsApi.schema(dataType),
+                ]);
+                const newProblems = problemsRes.data.problems;
+                setProblems(newProblems);
+                setTables(schemaRes.data);
+                setSelectedIndex(0);
+
+                // 문제 ID 비교하여 새 문제 세트면 제출 기록 초기화
+                const savedKey = `completed_${dataType}`;
+                const savedProblemIdsKey = `problem_ids_${dataType}`;
+                const currentProblemIds = newProblems.map((p: any) => p.problem_id).join(',');
+                const savedProblemIds = localStorage.getItem(savedProblemIdsKey);
+
+                if (savedProblemIds !== currentProblemIds) {
+                    // 새 문제 세트 - 기존 제출 기록 초기화
+                    localStorage.removeItem(savedKey);
+                    localStorage.setItem(savedProblemIdsKey, currentProblemIds);
+                    setCompletedStatus({});
+                } else {
+                    // 같은 문제 세트 - 저장된 기록 복원
+                    const saved = localStorage.getItem(savedKey);
+                    if (saved) {
+                        try { setCompletedStatus(JSON.parse(saved)); } catch { }
+                    }
+                }
+            } catch (error) {
+                console.error('Failed to load data:', error);
+            }
+        }
+        load();
+    }, [dataType]);
+
+    // Analytics: 페이지 로드 및 문제 선택 추적
+    useEffect(() => {
+        analytics.pageView(dataType === 'pa' ? '/pa-practice' : '/stream', { data_type: dataType });
+    }, [dataType]);
+
+    useEffect(() => {
+        if (selectedProblem) {
+            analytics.problemViewed(selectedProblem.problem_id, {
+                difficulty: selectedProblem.difficulty,
+                dataType,
+                isDaily: dataType === 'pa' || dataType === 'stream',
+                topic: selectedProblem.topic
+            });
+        }
+    }, [selectedProblem, dataType]);
+
+    // 제출 결과 기록
+    const handleSubmitted = useCallback((problemId: string, isCorrect: boolean) => {
+        setCompletedStatus(prev => {
+            const newStatus = {
+                ...prev,
+                [problemId]: {
+                    is_correct: isCorrect,
+                    submitted_at: new Date().toISOString()
+                }
+            };
+            localStorage.setItem(`completed_${dataType}`, JSON.stringify(newStatus));
+            return newStatus;
+        });
+    }, [dataType]);
+
+    // 좌우 리사이저
+    const handleMouseDown = useCallback((e: React.MouseEvent) => {
         e.preventDefault();
-        const rightPanel = rightPanelRef.current;
-        if (!rightPanel) return;
+        const container = containerRef.current;
+        if (!container) return;
 
         const handleMouseMove = (e: MouseEvent) => {
-            const rightPanelRect = rightPanel.getBoundingClientRect();
-            const newHeight = e.clientY - rightPanelRect.top;
-            setEditorHeight(Math.min(Math.max(newHeight, 150), rightPanelRect.height - 100));
+            const containerRect = container.getBoundingClientRect();
+            const newWidth = ((e.clientX - containerRect.left) / containerRect.width) * 100;
+            setLeftWidth(Math.min(Math.max(newWidth, 20), 80));
         };
 
         const handleMouseUp = () => {
@@ -228,16 +437,6 @@ export function Workspace({ dataType }: WorkspaceProps) {
         document.addEventListener('mouseup', handleMouseUp);
     }, []);
 
-    const getStatusIcon = (problemId: string) => {
-        const status = completedStatus[problemId];
-        if (!status) return '⬜';
-        return status.is_correct ? '✅' : '❌';
-    };
-
-    const difficultyIcon: Record<string, string> = {
-        easy: '🟢', medium: '🟡', hard: '🔴',
-    };
-
     return (
         <div className="workspace" ref={containerRef}>
             {/* 좌측 패널 */}
@@ -253,65 +452,15 @@ export function Workspace({ dataType }: WorkspaceProps) {
 
                 {activeTab === 'problem' ? (
                     <div className="problem-panel">
-                        <div className="problem-list">
-                            {problems.map((p, idx) => (
-                                <button
-                                    key={p.problem_id}
-                                    className={`problem-item ${selectedIndex === idx ? 'active' : ''}`}
-                                    onClick={() => { setSelectedIndex(idx); setSql(''); setSubmitResult(null); setResult(null); setHint(null); }}
-                                >
-                                    <span className="status">{getStatusIcon(p.problem_id)}</span>
-                                    <span className="num">{idx + 1}번</span>
-                                    <span className="difficulty">{difficultyIcon[p.difficulty]}</span>
-                                </button>
-                            ))}
-                        </div>
+                        <ProblemList
+                            problems={problems}
+                            selectedIndex={selectedIndex}
+                            completedStatus={completedStatus}
+                            onSelect={setSelectedIndex}
+                        />
 
                         {selectedProblem && (
-                            <div className="problem-detail">
-                                <div className="problem-title">
-                                    <span className="problem-number">문제 {selectedIndex + 1}</span>
-                                    <span className="difficulty-badge">
-                                        {difficultyIcon[selectedProblem.difficulty]} {selectedProblem.difficulty}
-                                    </span>
-                                </div>
-
-                                {selectedProblem.requester && (
-                                    <div className="slack-message">
-                                        <div className="slack-header">
-                                            <span className="slack-avatar">👤</span>
-                                            <span className="slack-sender">{selectedProblem.requester}</span>
-                                            <span className="slack-time">오늘 오전 10:30</span>
-                                        </div>
-                                        <div className="slack-content">
-                                            {renderMarkdown(selectedProblem.question)}
-                                        </div>
-                                        {selectedProblem.context && (
-                                            <div className="slack-context">
-                                                💡 {renderMarkdown(selectedProblem.context)}
-                                            </div>
-                                        )}
-                                    </div>
-                                )}
-
-                                {selectedProblem.expected_columns && (
-                                    <div className="section">
-                                        <div className="section-title">📊 결과 컬럼</div>
-                                        <div className="columns-box">
-                                            {selectedProblem.expected_columns.map((col, i) => (
-                                                <code key={i}>{col}</code>
-                                            ))}
-                                        </div>
-                                    </div>
-                                )}
-
-                                {selectedProblem.hint && (
-                                    <details className="hint-section">
-                                        <summary>💬 힌트 보기</summary>
-                                        <p>{selectedProblem.hint}</p>
-                                    </details>
-                                )}
-                            </div>
+                            <ProblemDetail problem={selectedProblem} index={selectedIndex} />
                         )}
 
                         {problems.length === 0 && (
@@ -328,94 +477,15 @@ export function Workspace({ dataType }: WorkspaceProps) {
             <div className="resizer" ref={resizerRef} onMouseDown={handleMouseDown} />
 
             {/* 우측 패널 */}
-            <div className="right-panel" ref={rightPanelRef} style={{ width: `${100 - leftWidth}%` }}>
-                <div className="editor-section" style={{ height: `${editorHeight}px` }}>
-                    <div className="editor-header">
-                        <span>💻 SQL</span>
-                        <span className="shortcut">Ctrl+Enter로 실행</span>
-                    </div>
-                    <div className="editor-shell">
-                        <SQLEditor
-                            value={sql}
-                            onChange={(val) => {
-                                setSql(val);
-                                if (selectedProblem && val.trim().length > 0) {
-                                    analytics.problemAttempted(selectedProblem.problem_id, selectedProblem.difficulty);
-                                }
-                            }}
-                            onExecute={handleExecute}
-                            height={`${editorHeight - 110}px`} // header(35) + actions(45) + border/padding
-                            tables={tables}
-                        />
-                    </div>
-                    <div className="editor-actions">
-                        <button onClick={handleExecute} disabled={loading} className="btn-execute">
-                            {loading ? '⏳ 실행 중...' : '▶️ 실행'}
-                        </button>
-                        <div className="spacer" />
-                        <button onClick={handleHint} disabled={hinting || !selectedProblem} className="btn-hint">
-                            {hinting ? '💭 생각 중...' : '💡 도움'}
-                        </button>
-                        <button onClick={handleSubmit} disabled={submitting || !selectedProblem} className="btn-submit">
-                            {submitting ? '🔄 채점 중...' : '✅ 제출'}
-                        </button>
-                    </div>
-                </div>
-
-                <div className="v-resizer" onMouseDown={handleMouseDownVertical} />
-
-                <div className="result-section">
-                    <div className="result-header">
-                        <span>📊 실행 결과</span>
-                        {result?.execution_time_ms && (
-                            <span className="exec-time">{result.execution_time_ms.toFixed(0)}ms</span>
-                        )}
-                    </div>
-
-                    <div className="result-content">
-                        {/* 로딩 상태 */}
-                        {(submitting || hinting) && (
-                            <div className="loading-state">
-                                <div className="loading-spinner" />
-                                <div className="loading-text">
-                                    {submitting ? '🤔 채점 중입니다...' : '💭 AI가 힌트를 생성하고 있습니다...'}
-                                </div>
-                            </div>
-                        )}
-
-                        {/* 힌트 */}
-                        {hint && !submitting && !hinting && (
-                            <div className="hint-result">
-                                <div className="hint-title">💡 AI 힌트</div>
-                                <div className="hint-content">{hint}</div>
-                            </div>
-                        )}
-
-                        {/* 제출 결과 */}
-                        {submitResult && !submitting && (
-                            <div className={`submit-result ${submitResult.is_correct ? 'correct' : 'wrong'}`}>
-                                <div className="result-icon">
-                                    {submitResult.is_correct ? '✅ 정답입니다!' : '❌ 틀렸습니다'}
-                                </div>
-                                <div className="feedback">{submitResult.feedback}</div>
-                            </div>
-                        )}
-
-                        {/* 쿼리 결과 */}
-                        {result && result.success && result.data && !submitting && !hinting && (
-                            <ResultTable columns={result.columns || []} data={result.data} />
-                        )}
-
-                        {result && !result.success && !submitting && !hinting && (
-                            <div className="error-result">❌ {result.error}</div>
-                        )}
-
-                        {!result && !submitResult && !hint && !submitting && !hinting && (
-                            <div className="empty-result">SQL을 작성하고 실행 버튼을 누르세요</div>
-                        )}
-                    </div>
-                </div>
-            </div>
+            <EditorPanel
+                problem={selectedProblem}
+                tables={tables}
+                dataType={dataType}
+                width={100 - leftWidth}
+                editorHeight={editorHeight}
+                onEditorHeightChange={setEditorHeight}
+                onSubmitted={handleSubmitted}
+            />
         </div>
     );
 }
@@ -339,7 +339,8 @@ def run_pa(save_to=("postgres","duckdb"), product_type: str = None):
         duck_con = _connect_duckdb()
         init_duckdb_schema(duck_con)
 
-    truncate_targets(pg_cur=pg_cur, duck_con=duck_con, modes=("pa",))
+    # PostgreSQL은 COPY와 같은 트랜잭션에서 비움 (생성 중에 빈 테이블이 보이지 않도록)
+    truncate_targets(duck_con=duck_con, modes=("pa",))
 
     users = []
     for _ in tqdm(range(cfg.PA_NUM_USERS), desc=f"PA ({product_type}): generating users"):
@@ -376,7 +377,7 @@ def run_pa(save_to=("postgres","duckdb"), product_type: str = None):
     events.sort(key=lambda x: x[3])
     orders.sort(key=lambda x: x[2])
 
-    # PostgreSQL: COPY 사용하여 고속 인서트
+    # PostgreSQL: TRUNCATE + COPY를 한 트랜잭션으로 (커밋 1회, 실패 시 기존 데이터 유지)
     if pg_cur:
         from io import StringIO
         
@@ -394,10 +395,19 @@ def run_pa(save_to=("postgres","duckdb"), product_type: str = None):
             pg_cur.copy_from(buf, table, columns=columns)
         
         logger.info("PA: using COPY for fast insert")
-        copy_insert('pa_users', ('user_id', 'signup_at', 'country', 'channel'), users, None)
-        copy_insert('pa_sessions', ('session_id', 'user_id', 'started_at', 'device'), sessions, None)
-        copy_insert('pa_events', ('event_id', 'user_id', 'session_id', 'event_time', 'event_name'), events, None)
-        copy_insert('pa_orders', ('order_id', 'user_id', 'order_time', 'amount'), orders, None)
+        pg_con.autocommit = False
+        try:
+            truncate_targets(pg_cur=pg_cur, modes=("pa",))
+            copy_insert('pa_users', ('user_id', 'signup_at', 'country', 'channel'), users, None)
+            copy_insert('pa_sessions', ('session_id', 'user_id', 'started_at', 'device'), sessions, None)
+            copy_insert('pa_events', ('event_id', 'user_id', 'session_id', 'event_time', 'event_name'), events, None)
+            copy_insert('pa_orders', ('order_id', 'user_id', 'order_time', 'amount'), orders, None)
+            pg_con.commit()
+        except Exception:
+            pg_con.rollback()
+            raise
+        finally:
+            pg_con.autocommit = True
 
     if duck_con:
         duck_con.executemany("INSERT INTO pa_users VALUES (?, ?, ?, ?)", users)
@@ -0,0 +1,243 @@
+# problems/batch.py
+"""
+야간 문제 생성 - Gemini Batch API
+- 새벽 스케줄러가 PA/Stream 출제 요청을 JSONL로 제출하고
+  수 시간 뒤 수집 작업이 결과를 받아 daily/monthly 파일로 저장한다
+- 동기 호출 대비 절반 가격, 별도 rate limit
+"""
+from __future__ import annotations
+
+import json
+from datetime import date
+from pathlib import Path
+from typing import Optional
+
+from google.genai import types
+
+from engine.postgres_engine import PostgresEngine
+from problems.gemini import get_client, MODEL, _parse_json_response, log_api_usage
+from problems import generator as pa_generator
+from problems import generator_stream as stream_generator
+from problems.prompt import build_prompt_text
+from common.logging import get_logger
+
+logger = get_logger(__name__)
+
+BATCH_DIR = Path("problems/.batch")
+STATE_PATH = BATCH_DIR / "pending.json"
+DAILY_DIR = Path("problems/daily")
+
+# 진행 중으로 간주하는 배치 상태
+PENDING_STATES = {
+    "JOB_STATE_QUEUED",
+    "JOB_STATE_PENDING",
+    "JOB_STATE_RUNNING",
+}
+SUCCEEDED_STATES = {
+    "JOB_STATE_SUCCEEDED",
+    "JOB_STATE_PARTIALLY_SUCCEEDED",
+}
+
+
+def _load_state() -> Optional[dict]:
+    if not STATE_PATH.exists():
+        return None
+    with open(STATE_PATH, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _save_state(state: dict):
+    BATCH_DIR.mkdir(parents=True, exist_ok=True)
+    with open(STATE_PATH, "w", encoding="utf-8") as f:
+        json.dump(state, f, ensure_ascii=False, indent=2)
+
+
+def _clear_state():
+    STATE_PATH.unlink(missing_ok=True)
+
+
+def _has_problems(monthly_data: dict, target_date: date) -> bool:
+    return any(p.get("date") == target_date.isoformat() for p in monthly_data["problems"])
+
+
+def _pa_exists(target_date: date) -> bool:
+    """해당 날짜 PA 문제가 이미 저장되었는지 (동기 생성/수동 실행 등)"""
+    if any(DAILY_DIR.glob(f"{target_date}*.json")):
+        return True
+    return _has_problems(pa_generator.load_monthly_file(target_date.strftime("%Y-%m")), target_date)
+
+
+def _stream_exists(target_date: date) -> bool:
+    """해당 날짜 Stream 문제가 이미 저장되었는지"""
+    if (DAILY_DIR / f"stream_{target_date}.json").exists():
+        return True
+    return _has_problems(stream_generator.load_monthly_file(target_date.strftime("%Y-%m")), target_date)
+
+
+def _batch_request(key: str, prompt: str) -> dict:
+    return {
+        "key": key,
+        "request": {"contents": [{"role": "user", "parts": [{"text": prompt}]}]},
+    }
+
+
+def build_batch_requests(today: date, pg: PostgresEngine) -> list[dict]:
+    """오늘 아직 없는 문제에 대한 Batch 요청 목록 생성"""
+    month_str = today.strftime("%Y-%m")
+    requests = []
+
+    if not _has_problems(pa_generator.load_monthly_file(month_str), today):
+        # 세트마다 동일한 프롬프트 (샘플링으로 서로 다른 문제가 나옴)
+        prompt = build_prompt_text(n=6)
+        for set_idx in range(pa_generator.NUM_PROBLEM_SETS):
+            requests.append(_batch_request(f"pa_{today}_{set_idx}", prompt))
+
+    if not _has_problems(stream_generator.load_monthly_file(month_str), today):
+        prompt = stream_generator.build_stream_generation_prompt(pg)
+        requests.append(_batch_request(f"stream_{today}", prompt))
+
+    return requests
+
+
+def submit_daily_batch(today: date, pg: PostgresEngine) -> Optional[str]:
+    """
+    오늘자 출제 요청을 Batch로 제출하고 배치 이름 반환
+    - 이미 제출된 배치가 있으면 재제출하지 않음
+    - 생성할 문제가 없으면 None
+    """
+    state = _load_state()
+    if state and state.get("date") == today.isoformat():
+        logger.info(f"batch for {today} already submitted: {state['batch_name']}")
+        return state["batch_name"]
+
+    requests = build_batch_requests(today, pg)
+    if not requests:
+        logger.info(f"problems for {today} already exist, no batch submitted")
+        return None
+
+    BATCH_DIR.mkdir(parents=True, exist_ok=True)
+    jsonl_path = BATCH_DIR / f"requests_{today}.jsonl"
+    with open(jsonl_path, "w", encoding="utf-8") as f:
+        for req in requests:
+            f.write(json.dumps(req, ensure_ascii=False) + "\n")
+
+    uploaded = get_client().files.upload(
+        file=str(jsonl_path),
+        config=types.UploadFileConfig(display_name=f"problems_{today}", mime_type="jsonl"),
+    )
+    job = get_client().batches.create(
+        model=MODEL,
+        src=uploaded.name,
+        config=types.CreateBatchJobConfig(display_name=f"daily_problems_{today}"),
+    )
+
+    _save_state({
+        "date": today.isoformat(),
+        "batch_name": job.name,
+        "keys": [req["key"] for req in requests],
+    })
+    logger.info(f"submitted batch {job.name} with {len(requests)} requests for {today}")
+    return job.name
+
+
+def _iter_batch_results(job) -> list[tuple[str, Optional[str], dict]]:
+    """배치 결과를 (key, 응답 텍스트, 사용량) 목록으로 변환"""
+    raw = get_client().files.download(file=job.dest.file_name)
+    results = []
+    for line in raw.decode("utf-8").splitlines():
+        if not line.strip():
+            continue
+        obj = json.loads(line)
+        key = obj.get("key", "")
+        if "response" not in obj:
+            logger.error(f"batch request {key} failed: {obj.get('error')}")
+            results.append((key, None, {}))
+            continue
+        response = types.GenerateContentResponse.model_validate(obj["response"])
+        usage = response.usage_metadata
+        results.append((key, response.text, {
+            "input_tokens": (usage.prompt_token_count or 0) if usage else 0,
+            "output_tokens": (usage.candidates_token_count or 0) if usage else 0,
+        }))
+    return results
+
+
+def collect_daily_batch(pg: PostgresEngine) -> str:
+    """
+    제출된 배치 결과 수집 후 문제 파일 저장
+    반환: "done" | "pending" | "failed" | "none"
+    """
+    state = _load_state()
+    if not state:
+        return "none"
+
+    target_date = date.fromisoformat(state["date"])
+    keys = state.get("keys", [])
+    need_pa = any(k.startswith("pa_") for k in keys) and not _pa_exists(target_date)
+    need_stream = any(k.startswith("stream_") for k in keys) and not _stream_exists(target_date)
+
+    # 그 사이 동기 생성 등으로 이미 저장된 경우: 결과를 기다리지 않고 배치 정리
+    if not need_pa and not need_stream:
+        logger.info(f"problems for {target_date} already exist, dropping batch {state['batch_name']}")
+        cancel_daily_batch()
+        return "done"
+
+    job = get_client().batches.get(name=state["batch_name"])
+    job_state = job.state.name if job.state else ""
+
+    if job_state in PENDING_STATES:
+        logger.info(f"batch {job.name} still {job_state}")
+        return "pending"
+
+    if job_state not in SUCCEEDED_STATES:
+        logger.error(f"batch {job.name} ended with {job_state}: {job.error}")
+        _clear_state()
+        return "failed"
+
+    pa_problems = []
+    stream_problems = None
+    for key, text, usage in _iter_batch_results(job):
+        if text is None:
+            continue
+        if usage:
+            log_api_usage("problem_generation_batch", MODEL, **usage)
+        try:
+            problems = _parse_json_response(text)
+            if key.startswith("pa_") and need_pa:
+                set_idx = int(key.rsplit("_", 1)[1])
+                pa_problems.extend(
+                    pa_generator.finalize_problem_set(problems, target_date, pg, set_idx)
+                )
+            elif key.startswith("stream_") and need_stream:
+                stream_problems = stream_generator.finalize_stream_problems(problems, target_date, pg)
+        except Exception as e:
+            logger.error(f"Failed to process batch result {key}: {e}")
+
+    if pa_problems:
+        pa_generator.save_daily_problems(target_date, pa_problems)
+    if stream_problems:
+        stream_generator.save_stream_problems(target_date, stream_problems)
+
+    _clear_state()
+    logger.info(
+        f"collected batch {job.name}: {len(pa_problems)} PA, "
+        f"{len(stream_problems or [])} stream problems for {target_date}"
+    )
+
+    # 필요한 문제 중 하나라도 비면 실패로 보고 → 호출 측이 동기 생성으로 나머지를 채움
+    if (need_pa and not pa_problems) or (need_stream and not stream_problems):
+        return "failed"
+    return "done"
+
+
+def cancel_daily_batch():
+    """시간 내 끝나지 않은 배치 취소 (동기 생성으로 대체할 때)"""
+    state = _load_state()
+    if not state:
+        return
+    try:
+        get_client().batches.cancel(name=state["batch_name"])
+        logger.info(f"cancelled batch {state['batch_name']}")
+    except Exception as e:
+        logger.warning(f"Failed to cancel batch {state['batch_name']}: {e}")
+    _clear_state()
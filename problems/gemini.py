@@ -2,11 +2,19 @@
 from __future__ import annotations
 
 import os
+import atexit
+import hashlib
 import json
 import re
+import asyncio
+import threading
+import time
 from datetime import datetime
+from pathlib import Path
+import httpx
 from dotenv import load_dotenv
 from google import genai
+from google.genai import types
 
 from common.logging import get_logger
 
@@ -17,9 +25,39 @@ load_dotenv()
 # -------------------------------------------------
 # Gemini Client
 # -------------------------------------------------
-client = genai.Client(
-    api_key=os.getenv("GEMINI_API_KEY")
-)
+# 프로세스 전체에서 공유하는 HTTP 연결 풀 (keep-alive로 TLS 핸드셰이크 재사용)
+_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=40)
+_http_client: httpx.Client | None = None
+_async_http_client: httpx.AsyncClient | None = None
+_client: genai.Client | None = None
+_client_lock = threading.Lock()
+
+
+def get_client() -> genai.Client:
+    """Gemini 클라이언트 (첫 호출 시 생성, 프로세스 전체 공유)"""
+    global _client, _http_client, _async_http_client
+    if _client is not None:
+        return _client
+    with _client_lock:
+        if _client is None:
+            _http_client = httpx.Client(limits=_HTTP_LIMITS)
+            _async_http_client = httpx.AsyncClient(limits=_HTTP_LIMITS)
+            _client = genai.Client(
+                api_key=os.getenv("GEMINI_API_KEY"),
+                http_options=types.HttpOptions(
+                    httpx_client=_http_client,
+                    httpx_async_client=_async_http_client,
+                ),
+            )
+    return _client
+
+
+def _close_http_client() -> None:
+    if _http_client is not None:
+        _http_client.close()
+
+
+atexit.register(_close_http_client)
 
 MODEL = os.getenv("GEMINI_MODEL", "gemini-1.5-pro")
 
@@ -57,24 +95,8 @@ def log_api_usage(purpose: str, model: str, input_tokens: int = 0, output_tokens
 # -------------------------------------------------
 # 1️⃣ 문제 출제용 (JSON 강제)
 # -------------------------------------------------
-def call_gemini_json(prompt: str, purpose: str = "problem_generation") -> list[dict]:
-    logger.info(f"calling gemini for {purpose}")
-
-    response = client.models.generate_content(
-        model=MODEL,
-        contents=prompt,
-    )
-
-    raw_text = response.text.strip()
-    logger.debug(f"raw gemini response:\n{raw_text}")
-    
-    # 토큰 사용량 추정 (정확한 값은 response.usage_metadata에서)
-    input_tokens = len(prompt) // 4  # 대략적 추정
-    output_tokens = len(raw_text) // 4
-    
-    # 사용량 로깅
-    log_api_usage(purpose=purpose, model=MODEL, input_tokens=input_tokens, output_tokens=output_tokens)
-
+def _parse_json_response(raw_text: str) -> list[dict]:
+    """Gemini 응답 텍스트에서 JSON 추출 및 파싱"""
     # ------------------------------------------------
     # 1. ```json ... ``` 코드블록 우선 추출
     # ------------------------------------------------
@@ -114,6 +136,156 @@ def call_gemini_json(prompt: str, purpose: str = "problem_generation") -> list[d
         ) from e
 
 
+def _generation_config(cached_content: str | None) -> types.GenerateContentConfig | None:
+    """컨텍스트 캐시(cached_content)가 있으면 생성 설정에 연결"""
+    if not cached_content:
+        return None
+    return types.GenerateContentConfig(cached_content=cached_content)
+
+
+def _token_usage(usage, prompt: str, output_text: str) -> tuple[int, int]:
+    """응답의 usage_metadata에서 (입력, 출력) 토큰 수 추출 - 없으면 글자 수로 추정"""
+    if usage is None:
+        return len(prompt) // 4, len(output_text) // 4
+    return usage.prompt_token_count or 0, usage.candidates_token_count or 0
+
+
+# 응답 디스크 캐시 (스케줄러 재시도/관리자 수동 실행이 같은 요청을 다시 보내지 않도록)
+RESPONSE_CACHE_DIR = Path("problems/.cache")
+
+
+def _response_cache_path(cache_key: str, prompt: str) -> Path:
+    digest = hashlib.sha256(f"{cache_key}\x00{prompt}".encode("utf-8")).hexdigest()
+    return RESPONSE_CACHE_DIR / f"{digest}.json"
+
+
+def _load_cached_response(path: Path) -> list[dict] | None:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, json.JSONDecodeError) as e:
+        logger.warning(f"ignoring broken gemini response cache {path}: {e}")
+        return None
+
+
+def _save_cached_response(path: Path, problems: list[dict]):
+    try:
+        RESPONSE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(problems, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.warning(f"failed to write gemini response cache {path}: {e}")
+
+
+def prune_response_cache(max_age_days: int) -> int:
+    """오래된 응답 캐시 파일 삭제 후 삭제 개수 반환"""
+    if not RESPONSE_CACHE_DIR.is_dir():
+        return 0
+    cutoff = time.time() - max_age_days * 86400
+    deleted = 0
+    with os.scandir(RESPONSE_CACHE_DIR) as entries:
+        for entry in entries:
+            try:
+                if entry.stat().st_mtime < cutoff:
+                    os.remove(entry.path)
+                    deleted += 1
+            except OSError:
+                continue
+    return deleted
+
+
+def call_gemini_json(
+    prompt: str,
+    purpose: str = "problem_generation",
+    cached_content: str | None = None,
+    cache_key: str | None = None,
+) -> list[dict]:
+    """
+    Gemini 호출 후 JSON 파싱 결과 반환
+    - cache_key를 주면 (cache_key, prompt) 기준으로 응답을 디스크에 저장하고 재사용
+      (같은 프롬프트로 여러 세트를 뽑는 경우 세트마다 다른 키를 줄 것)
+    """
+    cache_path = _response_cache_path(cache_key, prompt) if cache_key else None
+    if cache_path is not None:
+        cached = _load_cached_response(cache_path)
+        if cached is not None:
+            logger.info(f"using cached gemini response for {purpose} ({cache_key})")
+            return cached
+
+    logger.info(f"calling gemini for {purpose}")
+
+    # 스트리밍으로 받아 청크 텍스트만 누적 (긴 출제 응답에서 연결 유휴 타임아웃 방지)
+    parts = []
+    usage = None
+    for chunk in get_client().models.generate_content_stream(
+        model=MODEL,
+        contents=prompt,
+        config=_generation_config(cached_content),
+    ):
+        if chunk.text:
+            parts.append(chunk.text)
+        if chunk.usage_metadata is not None:
+            usage = chunk.usage_metadata
+
+    raw_text = "".join(parts).strip()
+    logger.debug(f"raw gemini response:\n{raw_text}")
+    
+    # 토큰 사용량 (마지막 청크의 usage_metadata, 없으면 추정)
+    input_tokens, output_tokens = _token_usage(usage, prompt, raw_text)
+    
+    # 사용량 로깅
+    log_api_usage(purpose=purpose, model=MODEL, input_tokens=input_tokens, output_tokens=output_tokens)
+
+    problems = _parse_json_response(raw_text)
+    if cache_path is not None:
+        _save_cached_response(cache_path, problems)
+    return problems
+
+
+async def call_gemini_json_async(
+    prompt: str,
+    purpose: str = "problem_generation",
+    cached_content: str | None = None,
+) -> list[dict]:
+    """call_gemini_json의 비동기 버전 - FastAPI 이벤트 루프를 막지 않음"""
+    logger.info(f"calling gemini (async) for {purpose}")
+
+    response = await get_client().aio.models.generate_content(
+        model=MODEL,
+        contents=prompt,
+        config=_generation_config(cached_content),
+    )
+
+    raw_text = response.text.strip()
+    logger.debug(f"raw gemini response:\n{raw_text}")
+
+    input_tokens, output_tokens = _token_usage(response.usage_metadata, prompt, raw_text)
+
+    # 사용량 로깅 (DB 쓰기는 스레드로 위임)
+    await asyncio.to_thread(
+        log_api_usage, purpose=purpose, model=MODEL, input_tokens=input_tokens, output_tokens=output_tokens
+    )
+
+    return _parse_json_response(raw_text)
+
+
+async def close_gemini_clients() -> None:
+    """비동기 클라이언트 연결 정리 (앱 종료 시, 생성된 적 없으면 무시)"""
+    global _client, _async_http_client
+    with _client_lock:
+        gemini_client, async_http_client = _client, _async_http_client
+        _client, _async_http_client = None, None
+    if gemini_client is None:
+        return
+    await gemini_client.aio.aclose()
+    # 직접 주입한 httpx 클라이언트는 SDK가 닫지 않음
+    await async_http_client.aclose()
+
+
 # -------------------------------------------------
 # 2️⃣ PA 채점용 (자연어 피드백)
 # -------------------------------------------------
@@ -171,7 +343,7 @@ def grade_pa_submission(
     # ---------------------------------------------
     # Gemini 호출
     # ---------------------------------------------
-    response = client.models.generate_content(
+    response = get_client().models.generate_content(
         model=MODEL,
         contents=prompt,
     )
@@ -179,8 +351,7 @@ def grade_pa_submission(
     feedback = response.text.strip()
     
     # 사용량 로깅
-    input_tokens = len(prompt) // 4
-    output_tokens = len(feedback) // 4
+    input_tokens, output_tokens = _token_usage(response.usage_metadata, prompt, feedback)
     log_api_usage(purpose="grading_feedback", model=MODEL, input_tokens=input_tokens, output_tokens=output_tokens)
 
     logger.info("gemini grading completed")
@@ -0,0 +1,60 @@
+# problems/gen_cache.py
+"""
+연습 문제 생성 결과 캐시 (프로세스 로컬)
+- 같은 (product_type, data_type, 데이터 요약)으로 생성된 문제는 구조가 거의 같으므로
+  일정 비율의 요청은 이전에 생성된 문제 중 하나를 돌려주고 Gemini 호출을 생략한다
+- 문제 풀이 다양성을 위해 풀에 최소 개수 이상 쌓였을 때만 재사용
+"""
+from __future__ import annotations
+
+import hashlib
+import os
+import random
+import threading
+from collections import OrderedDict, deque
+from typing import Optional
+
+# 재사용 확률 (0이면 항상 Gemini 호출)
+HIT_RATE = float(os.getenv("PRACTICE_CACHE_HIT_RATE", "0.5"))
+MIN_POOL_SIZE = 5
+MAX_PER_KEY = 500
+MAX_KEYS = 16
+
+_pools: "OrderedDict[bytes, deque]" = OrderedDict()
+_lock = threading.Lock()
+
+
+def cache_key(product_type: str, data_type: str, data_summary: str) -> bytes:
+    summary_hash = hashlib.blake2b(data_summary.encode("utf-8"), digest_size=16).hexdigest()
+    raw = f"{product_type}|{data_type}|{summary_hash}".encode("utf-8")
+    return hashlib.blake2b(raw, digest_size=16).digest()
+
+
+def draw(key: bytes) -> Optional[dict]:
+    """확률적으로 캐시된 문제 하나 반환 (미스면 None)"""
+    if HIT_RATE <= 0 or random.random() >= HIT_RATE:
+        return None
+    with _lock:
+        pool = _pools.get(key)
+        if not pool or len(pool) < MIN_POOL_SIZE:
+            return None
+        _pools.move_to_end(key)
+        return dict(random.choice(pool))
+
+
+def store(key: bytes, problem: dict):
+    """새로 생성된 문제를 풀에 추가"""
+    with _lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = _pools[key] = deque(maxlen=MAX_PER_KEY)
+        pool.append(dict(problem))
+        _pools.move_to_end(key)
+        # 데이터 요약이 바뀐 예전 키 정리
+        while len(_pools) > MAX_KEYS:
+            _pools.popitem(last=False)
+
+
+def clear():
+    with _lock:
+        _pools.clear()
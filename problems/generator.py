@@ -18,6 +18,9 @@ Path("problems/daily").mkdir(parents=True, exist_ok=True)
 
 NUM_PROBLEM_SETS = 3  # 하루에 생성할 문제 세트 수
 
+# 난이도별 기본 XP (문제에 xp_value가 없을 때)
+DIFFICULTY_XP = {"easy": 3, "medium": 5, "hard": 8}
+
 REQUIRED_FIELDS = {
     "problem_id",
     "difficulty",
@@ -78,9 +81,13 @@ def get_expected_result(pg: PostgresEngine, answer_sql: str, limit: int = 1000)
 def generate_single_set(today: date, pg: PostgresEngine, set_index: int) -> list:
     """단일 문제 세트 생성 - 정답 데이터 포함"""
     logger.info(f"generating PA problems set {set_index} for {today}")
-    problems = build_prompt()  # Gemini 호출
+    problems = build_prompt(cache_key=f"pa_{today}_set{set_index}")  # Gemini 호출
     logger.info(f"generated {len(problems)} problems from Gemini for set {set_index}")
+    return finalize_problem_set(problems, today, pg, set_index)
+
 
+def finalize_problem_set(problems: list, today: date, pg: PostgresEngine, set_index: int) -> list:
+    """Gemini가 출제한 문제 세트 검증 + 메타데이터/정답 결과 추가 (동기/Batch 공용)"""
     # 검증
     if len(problems) != 6:
         raise ValueError(f"문제는 반드시 6개여야 합니다. (세트 {set_index})")
@@ -105,13 +112,7 @@ def generate_single_set(today: date, pg: PostgresEngine, set_index: int) -> list
         p["set_index"] = set_index
         
         # XP 값 설정
-        if "xp_value" not in p:
-            if p["difficulty"] == "easy":
-                p["xp_value"] = 3
-            elif p["difficulty"] == "medium":
-                p["xp_value"] = 5
-            else:  # hard
-                p["xp_value"] = 8
+        p.setdefault("xp_value", DIFFICULTY_XP[p["difficulty"]])
         
         # 정답 결과 데이터 생성 (DB 테이블 대신 JSON에 저장)
         answer_sql = p.get("answer_sql")
@@ -152,6 +153,14 @@ def generate(today: date, pg: PostgresEngine) -> str:
         except Exception as e:
             logger.error(f"Failed to generate set {set_idx}: {e}")
     
+    return save_daily_problems(today, all_problems)
+
+
+def save_daily_problems(today: date, all_problems: list) -> str:
+    """오늘 문제를 월별 JSON에 누적하고 daily/세트별 파일로 저장"""
+    month_str = today.strftime("%Y-%m")
+    monthly_data = load_monthly_file(month_str)
+    
     # 월별 파일에 추가
     monthly_data["problems"].extend(all_problems)
     save_monthly_file(month_str, monthly_data)
@@ -10,6 +10,7 @@ from typing import List
 
 from engine.postgres_engine import PostgresEngine
 from problems.gemini import call_gemini_json
+from problems.generator import DIFFICULTY_XP
 from common.logging import get_logger
 
 logger = get_logger(__name__)
@@ -164,15 +165,24 @@ def generate_stream_problems(target_date: date, pg: PostgresEngine) -> str:
         logger.info(f"stream problems for {target_date} already exist, skipping")
         return str(PROBLEM_DIR / f"stream_{month_str}.json")
     
-    # 데이터 요약
-    data_summary = get_stream_data_summary(pg)
-    logger.info("stream data summary:\n%s", data_summary)
-    
     # 프롬프트 빌드 및 Gemini 호출
-    prompt = build_stream_prompt(data_summary, n=6)
-    problems = call_gemini_json(prompt)
+    prompt = build_stream_generation_prompt(pg)
+    problems = call_gemini_json(prompt, cache_key=f"stream_{target_date}")
     logger.info("generated %d stream problems from Gemini", len(problems))
     
+    finalize_stream_problems(problems, target_date, pg)
+    return save_stream_problems(target_date, problems)
+
+
+def build_stream_generation_prompt(pg: PostgresEngine) -> str:
+    """데이터 요약을 포함한 Stream 문제 생성 프롬프트 (동기/Batch 공용)"""
+    data_summary = get_stream_data_summary(pg)
+    logger.info("stream data summary:\n%s", data_summary)
+    return build_stream_prompt(data_summary, n=6)
+
+
+def finalize_stream_problems(problems: list, target_date: date, pg: PostgresEngine) -> list:
+    """Gemini가 출제한 Stream 문제에 메타데이터 및 정답 결과 추가"""
     # 문제에 메타데이터 및 정답 결과 추가
     for p in problems:
         original_id = p["problem_id"]
@@ -182,13 +192,7 @@ def generate_stream_problems(target_date: date, pg: PostgresEngine) -> str:
         
         # XP 값 설정
         if "xp_value" not in p:
-            diff = p.get("difficulty", "medium")
-            if diff == "easy":
-                p["xp_value"] = 3
-            elif diff == "medium":
-                p["xp_value"] = 5
-            else:
-                p["xp_value"] = 8
+            p["xp_value"] = DIFFICULTY_XP.get(p.get("difficulty", "medium"), DIFFICULTY_XP["hard"])
         
         # 정답 결과 데이터 생성 (JSON에 직접 저장)
         answer_sql = p.get("answer_sql")
@@ -202,6 +206,14 @@ def generate_stream_problems(target_date: date, pg: PostgresEngine) -> str:
             p["expected_result"] = []
             p["expected_row_count"] = 0
     
+    return problems
+
+
+def save_stream_problems(target_date: date, problems: list) -> str:
+    """Stream 문제를 월별 JSON에 누적하고 daily 파일로 저장"""
+    month_str = target_date.strftime("%Y-%m")
+    monthly_data = load_monthly_file(month_str)
+    
     # 월별 파일에 추가
     monthly_data["problems"].extend(problems)
     save_monthly_file(month_str, monthly_data)
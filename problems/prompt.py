@@ -5,97 +5,149 @@ prompt_pa와 gemini 모듈을 연결
 """
 from __future__ import annotations
 
-from engine.postgres_engine import PostgresEngine
-from config.db import PostgresEnv
-from problems.prompt_pa import build_pa_prompt
+from datetime import date
+from functools import lru_cache
+
+from backend.services.database import postgres_connection
+from problems.prompt_pa import build_pa_prompt, build_pa_dynamic_suffix
 from problems.gemini import call_gemini_json
+from problems.prompt_cache import get_or_create_daily_cache
 from common.logging import get_logger
 
 logger = get_logger(__name__)
 
 
 def get_data_summary() -> str:
-    """현재 PA 데이터 요약 생성 - Gemini에게 정확한 스키마 정보 제공"""
-    pg = PostgresEngine(PostgresEnv().dsn())
-    
+    """현재 PA 데이터 요약 생성 - Gemini에게 정확한 스키마 정보 제공 (일 단위 캐시)"""
+    return _build_data_summary(date.today())
+
+
+def clear_data_summary_cache():
+    """데이터 갱신 후 요약 캐시 무효화"""
+    _build_data_summary.cache_clear()
+
+
+# 테이블별 컬럼 설명 (요약 프롬프트용)
+_TABLES_INFO = [
+    ("pa_users", "user_id (TEXT PK), signup_at (TIMESTAMP), country (TEXT), channel (TEXT)"),
+    ("pa_sessions", "session_id (TEXT PK), user_id (TEXT FK), started_at (TIMESTAMP), device (TEXT)"),
+    ("pa_events", "event_id (TEXT PK), user_id (TEXT FK), session_id (TEXT FK), event_time (TIMESTAMP), event_name (TEXT)"),
+    ("pa_orders", "order_id (TEXT PK), user_id (TEXT FK), order_time (TIMESTAMP), amount (INT)")
+]
+
+# 건수 / 이벤트 유형 / 가입일 범위를 한 번의 왕복으로 조회
+_SUMMARY_SQL = """
+    SELECT
+        (SELECT COUNT(*) FROM pa_users) AS pa_users,
+        (SELECT COUNT(*) FROM pa_sessions) AS pa_sessions,
+        (SELECT COUNT(*) FROM pa_events) AS pa_events,
+        (SELECT COUNT(*) FROM pa_orders) AS pa_orders,
+        ARRAY(SELECT DISTINCT event_name FROM pa_events LIMIT 15) AS event_names,
+        r.min_date,
+        r.max_date
+    FROM (
+        SELECT MIN(signup_at)::date AS min_date, MAX(signup_at)::date AS max_date
+        FROM pa_users
+    ) r
+"""
+
+
+def _fetch_summary_sections(pg) -> dict:
+    """
+    요약에 필요한 값 조회 - 기본은 한 번의 왕복
+    - 일부 테이블/컬럼이 없어 통합 쿼리가 실패하면 항목별로 다시 조회 (실패 항목만 요약에서 제외)
+    """
     try:
-        summary_lines = ["## 테이블 구조 (PostgreSQL)"]
-        
-        # 테이블별 정보
-        tables_info = [
-            ("pa_users", "user_id (TEXT PK), signup_at (TIMESTAMP), country (TEXT), channel (TEXT)"),
-            ("pa_sessions", "session_id (TEXT PK), user_id (TEXT FK), started_at (TIMESTAMP), device (TEXT)"),
-            ("pa_events", "event_id (TEXT PK), user_id (TEXT FK), session_id (TEXT FK), event_time (TIMESTAMP), event_name (TEXT)"),
-            ("pa_orders", "order_id (TEXT PK), user_id (TEXT FK), order_time (TIMESTAMP), amount (INT)")
-        ]
-        
-        for table_name, columns in tables_info:
-            try:
-                df = pg.fetch_df(f"SELECT COUNT(*) as cnt FROM {table_name}")
-                count = int(df.iloc[0]["cnt"])
-                summary_lines.append(f"- {table_name}: {count:,}건")
-                summary_lines.append(f"  컬럼: {columns}")
-            except Exception as e:
-                summary_lines.append(f"- {table_name}: 조회 불가 ({e})")
-        
-        # 이벤트 유형
-        try:
-            df = pg.fetch_df("SELECT DISTINCT event_name FROM pa_events LIMIT 15")
-            event_names = [row["event_name"] for _, row in df.iterrows()]
-            summary_lines.append(f"\n## 이벤트 유형 (event_name)")
-            summary_lines.append(", ".join(event_names))
-        except Exception:
-            pass
-        
-        # 실제 데이터 날짜 범위
+        return pg.fetch_df(_SUMMARY_SQL).iloc[0].to_dict()
+    except Exception as e:
+        logger.warning(f"data summary query failed, falling back per section: {e}")
+    
+    sections = {}
+    for table_name, _ in _TABLES_INFO:
         try:
-            date_df = pg.fetch_df("""
-                SELECT 
-                    MIN(signup_at)::date as min_date,
-                    MAX(signup_at)::date as max_date
-                FROM pa_users
-            """)
-            min_date = date_df.iloc[0]["min_date"]
-            max_date = date_df.iloc[0]["max_date"]
-            summary_lines.append(f"\n## 데이터 날짜 범위 (중요!)")
-            summary_lines.append(f"- 가입일: {min_date} ~ {max_date}")
-            summary_lines.append(f"- answer_sql 작성 시 이 범위 내 날짜 사용 필수")
-        except Exception:
-            pass
-        
-        # 주의사항
-        summary_lines.append("\n## 주의사항")
-        summary_lines.append("- answer_sql은 반드시 위 테이블/컬럼만 사용")
-        summary_lines.append("- 존재하지 않는 컬럼 사용 금지 (예: signup_channel, event_type 없음)")
-        summary_lines.append("- division by zero 방지: NULLIF 또는 CASE 사용")
-        summary_lines.append("- 날짜 조건은 위 데이터 범위 내에서 사용")
-        
-        return "\n".join(summary_lines)
-    finally:
-        pg.close()
+            df = pg.fetch_df(f"SELECT COUNT(*) as cnt FROM {table_name}")
+            sections[table_name] = int(df.iloc[0]["cnt"])
+        except Exception as e:
+            sections[table_name] = e
+    try:
+        df = pg.fetch_df("SELECT DISTINCT event_name FROM pa_events LIMIT 15")
+        sections["event_names"] = df["event_name"].tolist()
+    except Exception:
+        sections["event_names"] = None
+    try:
+        df = pg.fetch_df("""
+            SELECT MIN(signup_at)::date as min_date, MAX(signup_at)::date as max_date
+            FROM pa_users
+        """)
+        sections["min_date"] = df.iloc[0]["min_date"]
+        sections["max_date"] = df.iloc[0]["max_date"]
+    except Exception:
+        sections["min_date"] = sections["max_date"] = None
+    return sections
+
+
+@lru_cache(maxsize=4)
+def _build_data_summary(_day: date) -> str:
+    with postgres_connection() as pg:
+        row = _fetch_summary_sections(pg)
+    
+    summary_lines = ["## 테이블 구조 (PostgreSQL)"]
+    
+    # 테이블별 정보
+    for table_name, columns in _TABLES_INFO:
+        count = row[table_name]
+        if isinstance(count, Exception):
+            summary_lines.append(f"- {table_name}: 조회 불가 ({count})")
+            continue
+        summary_lines.append(f"- {table_name}: {int(count):,}건")
+        summary_lines.append(f"  컬럼: {columns}")
+    
+    # 이벤트 유형
+    if row["event_names"] is not None:
+        summary_lines.append(f"\n## 이벤트 유형 (event_name)")
+        summary_lines.append(", ".join(row["event_names"]))
+    
+    # 실제 데이터 날짜 범위
+    if row["min_date"] is not None:
+        summary_lines.append(f"\n## 데이터 날짜 범위 (중요!)")
+        summary_lines.append(f"- 가입일: {row['min_date']} ~ {row['max_date']}")
+        summary_lines.append(f"- answer_sql 작성 시 이 범위 내 날짜 사용 필수")
+    
+    # 주의사항
+    summary_lines.append("\n## 주의사항")
+    summary_lines.append("- answer_sql은 반드시 위 테이블/컬럼만 사용")
+    summary_lines.append("- 존재하지 않는 컬럼 사용 금지 (예: signup_channel, event_type 없음)")
+    summary_lines.append("- division by zero 방지: NULLIF 또는 CASE 사용")
+    summary_lines.append("- 날짜 조건은 위 데이터 범위 내에서 사용")
+    
+    return "\n".join(summary_lines)
 
 
 def get_current_product_type() -> str:
     """현재 데이터의 Product Type 조회 (default: commerce)"""
-    pg = PostgresEngine(PostgresEnv().dsn())
     try:
-        df = pg.fetch_df("SELECT product_type FROM current_product_type WHERE id = 1")
+        with postgres_connection() as pg:
+            df = pg.fetch_df("SELECT product_type FROM current_product_type WHERE id = 1")
         if len(df) > 0:
             return str(df.iloc[0]["product_type"])
         return "commerce"  # 기본값
     except Exception:
         return "commerce"
-    finally:
-        pg.close()
 
 
-def build_prompt() -> list[dict]:
+def build_prompt_text(n: int = 6) -> str:
+    """Gemini 호출 없이 전체 PA 프롬프트만 생성 (Batch API 요청용)"""
+    product_type = get_current_product_type()
+    return build_pa_prompt(get_data_summary(), n=n, product_type=product_type)
+
+
+def build_prompt(cache_key: str | None = None) -> list[dict]:
     """
     generator.py에서 호출하는 메인 함수
     1. 현재 Product Type 조회
     2. 데이터 요약 생성
     3. Product Type 맞춤형 프롬프트 빌드
-    4. Gemini 호출
+    4. Gemini 호출 (cache_key가 있으면 같은 요청의 이전 응답 재사용)
     5. JSON 파싱 후 반환
     """
     # 현재 Product Type 조회
@@ -105,11 +157,21 @@ def build_prompt() -> list[dict]:
     data_summary = get_data_summary()
     logger.info(f"data summary generated:\n{data_summary}")
     
-    # Product Type을 전달하여 맞춤형 프롬프트 생성
-    prompt = build_pa_prompt(data_summary, n=6, product_type=product_type)
+    # Product Type을 전달하여 맞춤형 프롬프트 생성 (오늘자 prefix 캐시가 있으면 suffix만 전송)
+    cache_name = get_or_create_daily_cache(product_type, data_summary)
     logger.info("calling Gemini for problem generation")
     
-    problems = call_gemini_json(prompt)
+    # 응답 캐시 키에는 prefix 내용(product_type, 데이터 요약)까지 포함
+    if cache_key:
+        cache_key = f"{cache_key}|{product_type}|{data_summary}"
+    
+    if cache_name:
+        problems = call_gemini_json(
+            build_pa_dynamic_suffix(n=6), cached_content=cache_name, cache_key=cache_key
+        )
+    else:
+        prompt = build_pa_prompt(data_summary, n=6, product_type=product_type)
+        problems = call_gemini_json(prompt, cache_key=cache_key)
     logger.info(f"received {len(problems)} problems from Gemini")
     
     return problems
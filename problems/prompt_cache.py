@@ -0,0 +1,94 @@
+# problems/prompt_cache.py
+"""
+PA 프롬프트 prefix 일일 캐시 - Gemini Context Caching
+- 스키마/규칙/데이터 요약 prefix는 하루 동안 동일하므로 캐시로 등록해 두고
+  요청마다 suffix(출제 수량)만 전송한다
+"""
+from __future__ import annotations
+
+import hashlib
+import threading
+from datetime import date
+from typing import Optional
+
+from google.genai import types
+
+from problems.gemini import get_client, MODEL
+from problems.prompt_pa import build_pa_static_prefix
+from common.logging import get_logger
+
+logger = get_logger(__name__)
+
+CACHE_TTL = "86400s"  # 24시간
+
+# (날짜, product_type) -> (prefix 해시, 캐시 이름 또는 None)
+_daily_caches: dict[tuple[date, str], tuple[str, Optional[str]]] = {}
+_lock = threading.Lock()
+
+
+def get_or_create_daily_cache(product_type: str, data_summary: str) -> Optional[str]:
+    """
+    오늘자 prefix 캐시 이름 반환 (없으면 생성)
+    - 데이터가 갱신되어 prefix가 바뀌면 새로 생성하고 이전 캐시는 삭제
+    - 생성 실패 시 (최소 토큰 수 미달 등) None 반환 → 호출 측은 전체 프롬프트 사용
+    """
+    today = date.today()
+    key = (today, product_type)
+    prefix = build_pa_static_prefix(data_summary, product_type)
+    prefix_hash = hashlib.sha256(prefix.encode("utf-8")).hexdigest()
+
+    with _lock:
+        cached = _daily_caches.get(key)
+        if cached and cached[0] == prefix_hash:
+            return cached[1]
+
+    # 캐시 생성은 네트워크 호출이므로 락 밖에서 수행
+    name = _create_cache(product_type, today, prefix)
+
+    with _lock:
+        cached = _daily_caches.get(key)
+        if cached and cached[0] == prefix_hash:
+            # 다른 스레드가 먼저 같은 prefix로 생성함 → 방금 만든 캐시는 폐기
+            stale = [name]
+            name = cached[1]
+        else:
+            # 날짜가 바뀐 항목 + prefix가 바뀐 이전 캐시 정리
+            stale = [
+                _daily_caches.pop(k)[1]
+                for k in [k for k in _daily_caches if k[0] != today or k == key]
+            ]
+            _daily_caches[key] = (prefix_hash, name)
+
+    # 이전 캐시는 TTL 만료 전까지 저장 비용이 청구되므로 바로 삭제
+    for stale_name in stale:
+        _delete_cache(stale_name)
+    return name
+
+
+def _create_cache(product_type: str, today: date, prefix: str) -> Optional[str]:
+    """prefix 캐시 생성 - 실패 시 None"""
+    try:
+        cache = get_client().caches.create(
+            model=MODEL,
+            config=types.CreateCachedContentConfig(
+                display_name=f"pa_prefix_{product_type}_{today.isoformat()}",
+                contents=[prefix],
+                ttl=CACHE_TTL,
+            ),
+        )
+        logger.info(f"created gemini prompt cache {cache.name} for {product_type}")
+        return cache.name
+    except Exception as e:
+        logger.warning(f"gemini prompt cache unavailable for {product_type}: {e}")
+        return None
+
+
+def _delete_cache(name: Optional[str]) -> None:
+    """더 이상 쓰지 않는 캐시 삭제 (실패해도 TTL로 만료)"""
+    if not name:
+        return
+    try:
+        get_client().caches.delete(name=name)
+        logger.info(f"deleted gemini prompt cache {name}")
+    except Exception as e:
+        logger.warning(f"failed to delete gemini prompt cache {name}: {e}")
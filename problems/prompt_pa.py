@@ -114,6 +114,30 @@ PRODUCT_TYPE_CONTEXTS = {
 def build_pa_prompt(data_summary: str, n: int = 6, product_type: str = "commerce") -> str:
     """
     Product Type별 맞춤형 SQL 분석 문제 생성 프롬프트
+    - 하루 동안 변하지 않는 prefix 뒤에 요청별 suffix를 붙인다 (Gemini 컨텍스트 캐시 대상은 prefix)
+    """
+    return build_pa_static_prefix(data_summary, product_type) + "\n\n" + build_pa_dynamic_suffix(n)
+
+
+def build_pa_dynamic_suffix(n: int = 6) -> str:
+    """요청마다 달라지는 부분 (출제 수량/난이도 분배)"""
+    if n == 6:
+        distribution = "easy 2개, medium 2개, hard 2개"
+    else:
+        distribution = "easy/medium/hard 중 적절히 선택"
+
+    return f"""
+[출제 수량]
+1. 총 {n}개 문제
+2. 난이도 분배: {distribution}
+3. 위 JSON 스키마를 따르는 JSON 배열 형식으로만 출력
+""".strip()
+
+
+def build_pa_static_prefix(data_summary: str, product_type: str = "commerce") -> str:
+    """
+    하루 동안 동일한 프롬프트 앞부분 (스키마/규칙/예시)
+    - 데이터 요약과 Product Type이 같으면 결과가 같아야 캐시가 재사용된다
     """
     context = PRODUCT_TYPE_CONTEXTS.get(product_type, PRODUCT_TYPE_CONTEXTS["commerce"])
     events = get_events_for_type(product_type)
@@ -140,11 +164,10 @@ def build_pa_prompt(data_summary: str, n: int = 6, product_type: str = "commerce
 {events_str}
 
 [출제 요구사항]
-1. 총 {n}개 문제
-2. 난이도 분배: easy 2개, medium 2개, hard 2개
-3. **반드시 다른 팀/직무가 요청하는 형태**로 작성
-4. **answer_sql은 반드시 위 데이터 스키마에 맞게 작성** (실제 실행 가능해야 함)
-5. **{product_type.upper()} 프로덕트 특성에 맞는 문제만 출제**
+1. **반드시 다른 팀/직무가 요청하는 형태**로 작성
+2. **answer_sql은 반드시 위 데이터 스키마에 맞게 작성** (실제 실행 가능해야 함)
+3. **{product_type.upper()} 프로덕트 특성에 맞는 문제만 출제**
+4. 문제 수와 난이도 분배는 마지막 [출제 수량]을 따른다
 
 [{context['name']} 핵심 KPI]
 North Star: {kpi_guide.get('north_star', 'N/A')}
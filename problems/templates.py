@@ -1,64 +1,67 @@
 # problems/templates.py
 
-def build_expected_sql(problem: dict) -> str:
-    topic = problem.get("topic", "").lower()
-
-    if topic == "retention":
-        return """
+# topic별 정답 SQL 템플릿 (topic 조회는 dict 한 번)
+_TEMPLATES = {
+    "retention": """
         WITH cohort AS (
             SELECT
                 user_id,
                 date_trunc('day', signup_at) AS cohort_date
             FROM pa_users
         ),
-        activity AS (
+        cohort_size AS (
+            SELECT cohort_date, COUNT(*) AS n
+            FROM cohort
+            GROUP BY 1
+        ),
+        active AS (
             SELECT
                 c.cohort_date,
-                date_part('day', e.event_time - c.cohort_date) AS day_n,
-                COUNT(DISTINCT e.user_id)::float
-                / COUNT(DISTINCT c.user_id) AS retention_rate
+                e.event_time::date - c.cohort_date::date AS day_n,
+                COUNT(DISTINCT e.user_id) AS actives
             FROM cohort c
             JOIN pa_events e USING (user_id)
-            GROUP BY 1,2
+            WHERE e.event_time >= c.cohort_date
+              AND e.event_time < c.cohort_date + INTERVAL '8 day'
+            GROUP BY 1, 2
         )
-        SELECT cohort_date, day_n, retention_rate
-        FROM activity
-        WHERE day_n BETWEEN 0 AND 7
-        ORDER BY cohort_date, day_n
-        """
+        SELECT
+            a.cohort_date,
+            a.day_n,
+            a.actives::float / s.n AS retention_rate
+        FROM active a
+        JOIN cohort_size s USING (cohort_date)
+        ORDER BY a.cohort_date, a.day_n
+        """,
 
-    if topic == "funnel":
-        return """
-        WITH v AS (
-            SELECT DISTINCT user_id FROM pa_events WHERE event_name = 'view'
-        ),
-        c AS (
-            SELECT DISTINCT user_id FROM pa_events WHERE event_name = 'add_to_cart'
-        ),
-        p AS (
-            SELECT DISTINCT user_id FROM pa_events WHERE event_name = 'purchase'
+    "funnel": """
+        WITH u AS (
+            SELECT
+                user_id,
+                BOOL_OR(event_name = 'view') AS viewed,
+                BOOL_OR(event_name = 'add_to_cart') AS carted,
+                BOOL_OR(event_name = 'purchase') AS purchased
+            FROM pa_events
+            WHERE event_name IN ('view', 'add_to_cart', 'purchase')
+            GROUP BY user_id
         )
         SELECT
-            COUNT(v.user_id) AS view_users,
-            COUNT(c.user_id) AS cart_users,
-            COUNT(p.user_id) AS purchase_users
-        FROM v
-        LEFT JOIN c USING (user_id)
-        LEFT JOIN p USING (user_id)
-        """
+            COUNT(*) FILTER (WHERE viewed) AS view_users,
+            COUNT(*) FILTER (WHERE viewed AND carted) AS cart_users,
+            COUNT(*) FILTER (WHERE viewed AND purchased) AS purchase_users
+        FROM u
+        """,
 
-    if topic == "revenue":
-        return """
+    "revenue": """
         SELECT
             date_trunc('day', order_time) AS order_date,
             SUM(amount) AS revenue
         FROM pa_orders
         GROUP BY 1
         ORDER BY 1
-        """
+        """,
 
-    if topic == "marketing":
-        return """
+    "marketing": """
         SELECT
             device,
             COUNT(DISTINCT user_id) AS users
@@ -66,10 +69,9 @@ def build_expected_sql(problem: dict) -> str:
         GROUP BY 1
         ORDER BY users DESC
         LIMIT 10
-        """
+        """,
 
-    if topic == "cohort":
-        return """
+    "cohort": """
         SELECT
             date_trunc('week', signup_at) AS cohort_week,
             COUNT(DISTINCT user_id) AS users
@@ -77,10 +79,9 @@ def build_expected_sql(problem: dict) -> str:
         GROUP BY 1
         ORDER BY 1
         LIMIT 10
-        """
+        """,
 
-    if topic == "segmentation":
-        return """
+    "segmentation": """
         SELECT
             event_name,
             COUNT(DISTINCT user_id) AS users,
@@ -89,10 +90,15 @@ def build_expected_sql(problem: dict) -> str:
         GROUP BY 1
         ORDER BY users DESC
         LIMIT 10
-        """
+        """,
+}
 
-    # 알 수 없는 topic은 기본 쿼리 반환 (에러 방지)
-    return """
+# 알 수 없는 topic은 기본 쿼리 반환 (에러 방지)
+_PLACEHOLDER_SQL = """
     SELECT 1 AS placeholder
     """
 
+
+def build_expected_sql(problem: dict) -> str:
+    topic = problem.get("topic", "").lower()
+    return _TEMPLATES.get(topic, _PLACEHOLDER_SQL)
@@ -28,10 +28,19 @@ STREAM_REFRESH_WEEKDAY = int(os.getenv("STREAM_REFRESH_WEEKDAY", "6"))  # Sunday
 RUN_HOUR = int(os.getenv("RUN_HOUR", "9"))  # 매일 9시 실행
 
 
+# 스키마 초기화는 프로세스당 1회 (스케줄 루프가 매일 같은 DDL을 다시 읽고 실행하지 않도록)
+_duckdb_schema_ready = False
+
+
 def init_duckdb_schema(duck: DuckDBEngine):
-    """DuckDB 스키마 초기화 및 마이그레이션"""
+    """DuckDB 스키마 초기화 및 마이그레이션 (프로세스당 1회)"""
+    global _duckdb_schema_ready
+    if _duckdb_schema_ready:
+        return
+    
     try:
-        duck.execute(open("sql/init_duckdb.sql").read())
+        with open("sql/init_duckdb.sql", encoding="utf-8") as f:
+            duck.execute(f.read())
     except FileNotFoundError:
         logger.warning("[WARN] sql/init_duckdb.sql not found")
     
@@ -44,6 +53,8 @@ def init_duckdb_schema(duck: DuckDBEngine):
             duck.execute("ALTER TABLE daily_sessions ADD COLUMN problem_set_path TEXT")
         except Exception:
             pass  # 이미 있으면 무시
+    
+    _duckdb_schema_ready = True
 
 
 def run_daily_pipeline():
@@ -95,6 +106,8 @@ def run_daily_pipeline():
 
     # ---------------------------------------------
     # 4. Stream 데이터는 주 1회만 생성
+    # - PA와 병렬로 돌리지 않음: 생성 루프는 순수 Python(CPU, GIL)이고
+    #   DuckDB 파일은 단일 writer라 스레드로 나눠도 이득이 없음
     # ---------------------------------------------
     if weekday == STREAM_REFRESH_WEEKDAY:
         logger.info("[INFO] generating STREAM data (weekly)")
@@ -147,6 +160,23 @@ def run_daily_pipeline():
     logger.info("[DONE] Daily pipeline completed")
 
 
+# 긴 대기를 나눠 자는 단위 (초)
+SLEEP_CHUNK_SECONDS = 600
+
+
+def _sleep_until(target: datetime):
+    """
+    벽시계 기준 target 시각까지 대기
+    - time.sleep은 단조 시계 기준이라 호스트 절전/시계 보정 시 목표 시각에서 밀림
+    - 최대 SLEEP_CHUNK_SECONDS씩 나눠 자며 매번 현재 시각을 다시 확인
+    """
+    while True:
+        remaining = (target - datetime.now()).total_seconds()
+        if remaining <= 0:
+            return
+        time.sleep(min(remaining, SLEEP_CHUNK_SECONDS))
+
+
 def run_scheduler():
     """스케줄러 루프 - Docker 컨테이너에서 상시 실행"""
     logger.info(f"[SCHEDULER] Starting, will run at {RUN_HOUR}:00 daily")
@@ -165,7 +195,7 @@ def run_scheduler():
         wait_seconds = (next_run - now).total_seconds()
         logger.info(f"[SCHEDULER] Next run at {next_run}, waiting {wait_seconds/3600:.1f} hours")
         
-        time.sleep(wait_seconds)
+        _sleep_until(next_run)
         
         try:
             run_daily_pipeline()
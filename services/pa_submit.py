@@ -6,25 +6,13 @@ from typing import Dict, Any
 
 import pandas as pd
 
-from engine.postgres_engine import PostgresEngine
-from engine.duckdb_engine import DuckDBEngine
+from backend.services.database import postgres_connection, duckdb_connection
 from problems.gemini import grade_pa_submission
 from common.logging import get_logger
-from config.db import PostgresEnv, get_duckdb_path
 
 logger = get_logger(__name__)
 
 
-def _get_pg():
-    """PostgreSQL 연결 생성"""
-    return PostgresEngine(PostgresEnv().dsn())
-
-
-def _get_duck():
-    """DuckDB 연결 생성 (동시 접근 문제 방지)"""
-    return DuckDBEngine(get_duckdb_path())
-
-
 # ============================
 # 내부 헬퍼
 # ============================
@@ -33,19 +21,15 @@ def _run_user_sql(sql_text: str) -> pd.DataFrame:
     사용자 SQL 실행
     """
     logger.info("running user sql")
-    pg = _get_pg()
-    try:
+    with postgres_connection() as pg:
         return pg.fetch_df(sql_text)
-    finally:
-        pg.close()
 
 
 def _run_answer_sql(problem_id: str) -> pd.DataFrame:
     """
     문제별 정답 SQL 실행
     """
-    duck = _get_duck()
-    try:
+    with duckdb_connection() as duck:
         result = duck.fetchone(
             """
             SELECT answer_sql
@@ -54,18 +38,13 @@ def _run_answer_sql(problem_id: str) -> pd.DataFrame:
             """,
             [problem_id],
         )
-    finally:
-        duck.close()
     
     if result is None:
         raise ValueError(f"problem_id={problem_id}의 정답 SQL을 찾을 수 없습니다")
     
     logger.info(f"running answer sql for {problem_id}")
-    pg = _get_pg()
-    try:
+    with postgres_connection() as pg:
         return pg.fetch_df(result["answer_sql"])
-    finally:
-        pg.close()
 
 
 def _compare_df(user_df: pd.DataFrame, answer_df: pd.DataFrame) -> Dict[str, Any]:
@@ -195,8 +174,7 @@ def _save_submission(
     session_date: str,
     submitted_at: datetime,
 ):
-    duck = _get_duck()
-    try:
+    with duckdb_connection() as duck:
         duck.insert("pa_submissions", {
             "session_date": session_date,
             "problem_id": problem_id,
@@ -205,5 +183,3 @@ def _save_submission(
             "feedback": feedback,
             "submitted_at": submitted_at,
         })
-    finally:
-        duck.close()
@@ -0,0 +1,82 @@
+# tests/test_grading_service.py
+"""
+채점 서비스 compare_results 단위 테스트
+"""
+import pandas as pd
+from backend.services.grading_service import compare_results
+
+
+class TestCompareResults:
+    """compare_results 함수 테스트"""
+    
+    def test_identical_frames(self):
+        """동일한 결과는 정답"""
+        df1 = pd.DataFrame({"a": [1, 2], "b": ["x", "y"]})
+        df2 = pd.DataFrame({"a": [1, 2], "b": ["x", "y"]})
+        is_correct, _ = compare_results(df1, df2)
+        assert is_correct
+    
+    def test_row_order_ignored(self):
+        """행 순서가 달라도 정답"""
+        df1 = pd.DataFrame({"a": [2, 1, 3], "b": ["y", "x", "z"]})
+        df2 = pd.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "z"]})
+        is_correct, _ = compare_results(df1, df2)
+        assert is_correct
+    
+    def test_column_order_and_case_ignored(self):
+        """컬럼 순서/대소문자가 달라도 정답"""
+        df1 = pd.DataFrame({"B": ["x", "y"], "A": [1, 2]})
+        df2 = pd.DataFrame({"a": [1, 2], "b": ["x", "y"]})
+        is_correct, _ = compare_results(df1, df2)
+        assert is_correct
+    
+    def test_duplicate_rows_counted(self):
+        """중복 행 개수가 다르면 오답"""
+        df1 = pd.DataFrame({"a": [1, 1, 2]})
+        df2 = pd.DataFrame({"a": [1, 2, 2]})
+        is_correct, _ = compare_results(df1, df2)
+        assert not is_correct
+    
+    def test_value_mismatch_message(self):
+        """값 불일치 시 위치와 값을 알려줌"""
+        df1 = pd.DataFrame({"a": [1, 3]})
+        df2 = pd.DataFrame({"a": [1, 2]})
+        is_correct, feedback = compare_results(df1, df2)
+        assert not is_correct
+        assert "2번째 행 'a'" in feedback
+    
+    def test_column_count_mismatch(self):
+        """컬럼 수가 다르면 오답"""
+        df1 = pd.DataFrame({"a": [1], "b": [2]})
+        df2 = pd.DataFrame({"a": [1]})
+        is_correct, feedback = compare_results(df1, df2)
+        assert not is_correct
+        assert "컬럼 수" in feedback
+    
+    def test_inputs_not_mutated(self):
+        """비교 과정에서 입력 DataFrame 컬럼은 변경되지 않음"""
+        df1 = pd.DataFrame({"B": [1], "A": [2]})
+        df2 = pd.DataFrame({"a": [2], "b": [1]})
+        compare_results(df1, df2)
+        assert list(df1.columns) == ["B", "A"]
+    
+    def test_int_float_dtype_mismatch(self):
+        """정수/실수 타입 차이는 값이 같으면 정답"""
+        df1 = pd.DataFrame({"a": [1, 2]})
+        df2 = pd.DataFrame({"a": [1.0, 2.0]})
+        is_correct, _ = compare_results(df1, df2)
+        assert is_correct
+    
+    def test_datetime_vs_iso_string(self):
+        """DB 날짜와 JSON isoformat 문자열 정답 비교"""
+        df1 = pd.DataFrame({"d": pd.to_datetime(["2024-01-01", "2024-01-02"])})
+        df2 = pd.DataFrame({"d": ["2024-01-02T00:00:00", "2024-01-01T00:00:00"]})
+        is_correct, _ = compare_results(df1, df2)
+        assert is_correct
+    
+    def test_mixed_str_int_object_column(self):
+        """object 컬럼의 문자열 '1'과 정수 1은 다른 값 (해시 비교로 정답 처리 금지)"""
+        df1 = pd.DataFrame({"a": ["1", "x"]})
+        df2 = pd.DataFrame({"a": [1, "x"]})
+        is_correct, _ = compare_results(df1, df2)
+        assert not is_correct
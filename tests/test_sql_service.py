@@ -0,0 +1,54 @@
+# tests/test_sql_service.py
+"""
+SQL 실행 서비스 is_safe_sql / wrap_with_limit 단위 테스트
+"""
+import pytest
+from backend.services.sql_service import is_safe_sql, wrap_with_limit
+
+
+class TestIsSafeSql:
+    """is_safe_sql 함수 테스트"""
+    
+    def test_select_allowed(self):
+        """SELECT 문은 허용"""
+        assert is_safe_sql("SELECT * FROM pa_users") == (True, None)
+    
+    @pytest.mark.parametrize("sql, keyword", [
+        ("DROP TABLE pa_users", "DROP"),
+        ("  delete from pa_users", "DELETE"),
+        ("\nTruncate pa_orders", "TRUNCATE"),
+        ("EXECUTE stmt", "EXECUTE"),
+    ])
+    def test_dangerous_keyword_blocked(self, sql, keyword):
+        """위험 키워드로 시작하면 대소문자/공백과 무관하게 차단"""
+        is_safe, message = is_safe_sql(sql)
+        assert not is_safe
+        assert message.startswith(keyword)
+    
+    def test_cte_select_allowed(self):
+        """WITH ... SELECT 문은 허용"""
+        assert is_safe_sql("with t AS (SELECT 1) SELECT * FROM t;")[0]
+    
+    def test_multiple_statements_blocked(self):
+        """다중 쿼리 차단"""
+        is_safe, message = is_safe_sql("SELECT 1; SELECT 2")
+        assert not is_safe
+        assert "하나의 SELECT" in message
+
+
+class TestWrapWithLimit:
+    """결과 행 수 제한 래핑 테스트"""
+
+    def test_wraps_query_as_subquery(self):
+        wrapped = wrap_with_limit("SELECT * FROM pa_users;", 100)
+        assert wrapped.startswith("SELECT * FROM (")
+        assert wrapped.endswith(") AS _q LIMIT 100")
+        assert ";" not in wrapped
+
+    def test_existing_limit_still_capped(self):
+        wrapped = wrap_with_limit("SELECT * FROM pa_users LIMIT 100000", 50)
+        assert wrapped.endswith("LIMIT 50")
+
+    def test_trailing_comment_does_not_swallow_paren(self):
+        wrapped = wrap_with_limit("SELECT 1 -- 주석", 10)
+        assert "\n) AS _q" in wrapped